@@ -5,14 +5,26 @@ Uses Claude (via CLI or API) to extract high-quality memories from conversations
 Falls back to regex-based extraction if Claude is unavailable.
 """
 
+import functools
+import hashlib
 import json
 import os
-import subprocess
+import re
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 
+from llm_cache import LLMCache
+
+# Optional: orjson is a C-implemented JSON parser, noticeably faster on the
+# multi-KB responses Claude returns. Falls back to stdlib json.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from learning_prompts import (
     LearningPrompt,
     get_prompt_for_trigger,
@@ -26,8 +38,68 @@ from constants import (
     CLAUDE_TIMEOUT,
     EXTRACTION_BACKENDS,
     EXTRACTION_DEFAULT_BACKEND,
+    MEMORY_CATEGORIES,
 )
 
+# Frozenset for O(1) category validation in the response-parsing hot path
+_VALID_CATEGORIES = frozenset(MEMORY_CATEGORIES)
+
+# Content shorter than this is too fragmentary to be worth storing
+_MIN_CONTENT_LENGTH = 15
+
+# Matches a complete ```json ... ``` fenced block; compiled once at import
+_FENCE_RE = re.compile(r'^```[a-zA-Z]*\s*(.*?)\s*```\s*$', re.DOTALL)
+
+# Bump when extraction prompts change so stale cached responses are not reused
+PROMPT_VERSION = "1"
+
+
+def _hash_key(*parts: str) -> str:
+    """
+    Digest of multiple components with 8-byte length prefixes.
+
+    Prefixing each part with its length makes the hash input unambiguous:
+    ("a", "bc") and ("ab", "c") produce different digests even though their
+    concatenation is identical.
+    """
+    h = hashlib.sha256()
+    for part in parts:
+        data = part.encode()
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _clamp_relevance(value: Any, default: float = 0.8) -> float:
+    """Coerce a relevance value to a float in [0, 1]."""
+    try:
+        return max(0.0, min(1.0, float(value)))
+    except (TypeError, ValueError):
+        return default
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_cli() -> bool:
+    """Check once per process whether the Claude CLI is installed."""
+    import subprocess  # Deferred: regex-only extraction never forks
+
+    try:
+        result = subprocess.run(
+            ["claude", "--version"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        return result.returncode == 0
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_api() -> bool:
+    """Check once per process whether the Anthropic API key is set."""
+    return bool(os.environ.get("ANTHROPIC_API_KEY"))
+
 
 @dataclass
 class ExtractedMemory:
@@ -76,6 +148,12 @@ class ClaudeExtractor:
         self._cli_available: Optional[bool] = None
         self._api_available: Optional[bool] = None
 
+        # Content-addressable cache so identical transcripts skip the roundtrip
+        self._cache: Optional[LLMCache] = None
+        if extraction_config.get("cache_enabled", True):
+            cache_dir = extraction_config.get("cache_dir", ".memorylane/llm_cache")
+            self._cache = LLMCache(Path(cache_dir))
+
     def _get_config(self, key: str, default: Any = None) -> Any:
         """Get config value with dot notation support."""
         if not self.config:
@@ -90,25 +168,16 @@ class ClaudeExtractor:
 
     @property
     def cli_available(self) -> bool:
-        """Check if Claude CLI is available."""
+        """Check if Claude CLI is available (probed once per process)."""
         if self._cli_available is None:
-            try:
-                result = subprocess.run(
-                    ["claude", "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                self._cli_available = result.returncode == 0
-            except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-                self._cli_available = False
+            self._cli_available = _probe_cli()
         return self._cli_available
 
     @property
     def api_available(self) -> bool:
-        """Check if Anthropic API is available."""
+        """Check if Anthropic API is available (probed once per process)."""
         if self._api_available is None:
-            self._api_available = bool(os.environ.get("ANTHROPIC_API_KEY"))
+            self._api_available = _probe_api()
         return self._api_available
 
     def extract(
@@ -136,7 +205,9 @@ class ClaudeExtractor:
         Returns:
             List of extracted memories
         """
-        if not text or not text.strip():
+        # Short-circuit before any backend dispatch (isspace avoids the
+        # stripped-copy allocation)
+        if not text or text.isspace():
             return []
 
         # Detect trigger type if not specified
@@ -162,17 +233,12 @@ class ClaudeExtractor:
 
         if self.backend == "claude":
             # Claude only, no fallback
-            response = self._call_claude(prompt.system_prompt, user_message)
-            if response:
-                return self._parse_response(response)
-            return []
+            return self._call_and_parse(prompt.system_prompt, user_message) or []
 
         # "auto" mode: try Claude, then local LLM, then regex
-        response = self._call_claude(prompt.system_prompt, user_message)
-        if response:
-            memories = self._parse_response(response)
-            if memories:
-                return memories
+        memories = self._call_and_parse(prompt.system_prompt, user_message)
+        if memories:
+            return memories
 
         # Try local LLM fallback
         memories = self._local_llm_extraction(text)
@@ -182,18 +248,68 @@ class ClaudeExtractor:
         # Final fallback: regex
         return self._regex_extraction(text)
 
+    def _cache_key(self, system_prompt: str, user_message: str) -> str:
+        """Cache key over model, prompt version, and both prompt parts."""
+        return _hash_key(self.model, PROMPT_VERSION, system_prompt, user_message)
+
+    def _call_and_parse(
+        self,
+        system_prompt: str,
+        user_message: str,
+        retries: int = 2,
+    ) -> Optional[List[ExtractedMemory]]:
+        """
+        Call Claude and parse the response, retrying with feedback on failure.
+
+        When a response comes back but fails to parse into any memories, the
+        parse failure is fed back to the model for a cheap self-correction
+        instead of falling through to the slower local-LLM/regex backends.
+
+        Returns None when no Claude backend is reachable, an empty list when
+        all attempts produced unparseable output.
+        """
+        message = user_message
+        for _ in range(retries + 1):
+            response = self._call_claude(system_prompt, message)
+            if response is None:
+                return None  # Backend unavailable - nothing to retry
+
+            memories = self._parse_response(response)
+            if memories:
+                return memories
+
+            message = (
+                f"{user_message}\n\n"
+                "Your previous output could not be parsed into the required "
+                "JSON schema. Respond with only valid JSON this time."
+            )
+
+        return []
+
     def _call_claude(self, system_prompt: str, user_message: str) -> Optional[str]:
-        """Call Claude using CLI or API."""
+        """Call Claude using CLI or API, consulting the response cache first."""
+        key = None
+        if self._cache is not None:
+            key = self._cache_key(system_prompt, user_message)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = None
         if self.use_cli and self.cli_available:
-            return self._call_cli(system_prompt, user_message)
+            response = self._call_cli(system_prompt, user_message)
+        elif self.api_available:
+            response = self._call_api(system_prompt, user_message)
 
-        if self.api_available:
-            return self._call_api(system_prompt, user_message)
+        if response and key is not None:
+            self._cache.set(key, response)
 
-        return None
+        return response
 
     def _call_cli(self, system_prompt: str, user_message: str) -> Optional[str]:
         """Call Claude using the CLI."""
+        import subprocess  # Deferred: regex-only extraction never forks
+
         try:
             # Use claude CLI with --print flag for non-interactive mode
             # Pass the combined prompt via stdin
@@ -259,39 +375,24 @@ class ClaudeExtractor:
             return memories
 
         try:
-            data = json.loads(json_str)
+            data = _json_loads(json_str)
 
             # Handle both "memories" and "memory_entries" keys
             entries = data.get("memories") or data.get("memory_entries") or []
 
-            for entry in entries:
-                category = entry.get("category", "insights")
-                content = entry.get("content", "").strip()
-                relevance = entry.get("relevance", 0.8)
-                tags = entry.get("tags", [])
-
-                # Validate
-                if not content:
-                    continue
-                if len(content) < 15:
-                    continue
-                if category not in {"patterns", "insights", "learnings", "context"}:
-                    category = "insights"
-
-                try:
-                    relevance = float(relevance)
-                    relevance = max(0.0, min(1.0, relevance))
-                except (TypeError, ValueError):
-                    relevance = 0.8
-
-                memories.append(ExtractedMemory(
-                    category=category,
+            # Single pass: filter short content, normalize category and relevance
+            memories = [
+                ExtractedMemory(
+                    category=category if (category := entry.get("category", "insights")) in _VALID_CATEGORIES else "insights",
                     content=content,
-                    relevance=relevance,
-                    tags=tags if isinstance(tags, list) else [],
-                ))
+                    relevance=_clamp_relevance(entry.get("relevance", 0.8)),
+                    tags=tags if isinstance(tags := entry.get("tags", []), list) else [],
+                )
+                for entry in entries
+                if len(content := entry.get("content", "").strip()) >= _MIN_CONTENT_LENGTH
+            ]
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:  # json.JSONDecodeError / orjson.JSONDecodeError
             self._log_debug(f"JSON parse error: {e}")
 
         return memories
@@ -303,14 +404,16 @@ class ClaudeExtractor:
 
         text = text.strip()
 
-        # Remove markdown code blocks
+        # Remove markdown code blocks (precompiled matcher, slicing fallback)
         if text.startswith("```"):
-            lines = text.splitlines()
-            if len(lines) >= 2:
-                lines = lines[1:]  # Remove opening fence
-                if lines and lines[-1].strip().startswith("```"):
-                    lines = lines[:-1]  # Remove closing fence
-                text = "\n".join(lines).strip()
+            fence_match = _FENCE_RE.match(text)
+            if fence_match:
+                text = fence_match.group(1)
+            else:
+                # Unterminated fence: drop the opening line only
+                first_newline = text.find("\n")
+                if first_newline != -1:
+                    text = text[first_newline + 1:].strip()
 
         # Find JSON object
         start = text.find("{")
@@ -5,6 +5,7 @@ Adapted from ace-system-skill CLI patterns
 """
 
 import argparse
+import functools
 import json
 import sys
 from pathlib import Path
@@ -18,37 +19,62 @@ from conversation_learner import ConversationLearner
 from curation_manager import CurationManager
 from project_registry import ProjectRegistry, ensure_registered
 
+# Output templates built once at import; cmd_status fills and writes them in
+# one writelines call instead of composing f-strings per line
+_STATUS_HEADER_TEMPLATE = (
+    "🧠 MemoryLane Status\n"
+    + "=" * 50 + "\n"
+    "Total Memories: {total_memories}\n"
+    "Total Retrievals: {total_retrievals}\n"
+    "\n"
+    "📊 Memories by Category:\n"
+)
+
+_STATUS_CATEGORY_TEMPLATE = (
+    "  {category}: {count} memories (avg relevance: {avg_relevance})\n"
+)
+
+_STATUS_SAVINGS_TEMPLATE = (
+    "💰 Cost Savings:\n"
+    "  This week: ${week:.2f}\n"
+    "  This month: ${month:.2f}\n"
+    "  Total: ${total:.2f}\n"
+    "\n"
+    "📉 Compression Ratio: {avg_ratio:.1f}x\n"
+    "   ({avg_before:,} → {avg_after:,} tokens)\n"
+)
+
 
 class MemoryLaneCLI:
     """Command-line interface for MemoryLane"""
 
     def __init__(self, auto_register: bool = True):
         self.config = ConfigManager()
-        self.store = MemoryStore(
-            self.config.get_path('memories_file')
-        )
+        self._store_path = self.config.get_path('memories_file')
         self.registry = ProjectRegistry()
 
         # Auto-register this project in global registry
         if auto_register:
             ensure_registered()
 
+    @functools.cached_property
+    def store(self) -> MemoryStore:
+        """Memory store, loaded lazily so config-only commands skip disk I/O."""
+        return MemoryStore(self._store_path)
+
     def cmd_status(self, args):
         """Show MemoryLane status and cost savings"""
         stats = self.store.get_stats()
         metrics_file = self.config.get_path('metrics_file')
 
-        print("🧠 MemoryLane Status")
-        print("=" * 50)
-        print(f"Total Memories: {stats['total_memories']}")
-        print(f"Total Retrievals: {stats['total_retrievals']}")
-        print()
-
-        print("📊 Memories by Category:")
+        lines = [_STATUS_HEADER_TEMPLATE.format_map(stats)]
         for category, cat_stats in stats['categories'].items():
-            print(f"  {category.ljust(15)}: {cat_stats['count']} memories "
-                  f"(avg relevance: {cat_stats['avg_relevance']})")
-        print()
+            lines.append(_STATUS_CATEGORY_TEMPLATE.format(
+                category=category.ljust(15),
+                count=cat_stats['count'],
+                avg_relevance=cat_stats['avg_relevance'],
+            ))
+        lines.append("\n")
 
         # Cost savings
         if metrics_file.exists():
@@ -56,17 +82,19 @@ class MemoryLaneCLI:
                 metrics = json.load(f)
 
             savings = metrics.get('cost_savings', {})
-            print("💰 Cost Savings:")
-            print(f"  This week: ${savings.get('week', 0):.2f}")
-            print(f"  This month: ${savings.get('month', 0):.2f}")
-            print(f"  Total: ${savings.get('total', 0):.2f}")
-            print()
-
             compression = metrics.get('compression', {})
-            print(f"📉 Compression Ratio: {compression.get('avg_ratio', 0):.1f}x")
-            print(f"   ({compression.get('avg_before', 0):,} → {compression.get('avg_after', 0):,} tokens)")
+            lines.append(_STATUS_SAVINGS_TEMPLATE.format(
+                week=savings.get('week', 0),
+                month=savings.get('month', 0),
+                total=savings.get('total', 0),
+                avg_ratio=compression.get('avg_ratio', 0),
+                avg_before=compression.get('avg_before', 0),
+                avg_after=compression.get('avg_after', 0),
+            ))
         else:
-            print("💰 Cost tracking not yet initialized")
+            lines.append("💰 Cost tracking not yet initialized\n")
+
+        sys.stdout.writelines(lines)
 
     def cmd_recall(self, args):
         """Recall memories about a topic"""
@@ -74,34 +102,29 @@ class MemoryLaneCLI:
         print(f"🔍 Recalling memories about: {query}")
         print("=" * 50)
 
-        # Simple keyword search for MVP
-        # TODO: Replace with semantic search using embeddings
-        all_memories = self.store.get_memories()
-
-        matches = [
-            m for m in all_memories
-            if query.lower() in m['content'].lower()
-        ]
+        # Token-index search with substring fallback (see MemoryStore.search)
+        matches = self.store.search(query)
 
         if not matches:
             print("No memories found matching that query.")
             return
 
-        matches.sort(key=lambda m: m['relevance_score'], reverse=True)
-
         show_ids = getattr(args, 'show_ids', False)
         show_stars = getattr(args, 'show_stars', False)
 
-        for i, memory in enumerate(matches[:10], 1):
-            id_part = f" {memory['id']}" if show_ids else ""
-            score = memory.get('relevance_score', 0)
-            stars_part = ""
-            if show_stars:
-                stars = "⭐" * int(score * 5)
-                stars_part = f" {stars}"
-            print(f"{i}. [{memory['category']}]{id_part} {memory['content']}{stars_part} ({score:.2f})")
-            print(f"   Source: {memory['source']} | Used: {memory['usage_count']} times")
-            print()
+        def format_matches():
+            """Yield output lines lazily instead of materializing a list"""
+            for i, memory in enumerate(matches[:10], 1):
+                id_part = f" {memory['id']}" if show_ids else ""
+                score = memory.get('relevance_score', 0)
+                stars_part = ""
+                if show_stars:
+                    stars = "⭐" * int(score * 5)
+                    stars_part = f" {stars}"
+                yield f"{i}. [{memory['category']}]{id_part} {memory['content']}{stars_part} ({score:.2f})\n"
+                yield f"   Source: {memory['source']} | Used: {memory['usage_count']} times\n\n"
+
+        sys.stdout.writelines(format_matches())
 
     def cmd_insights(self, args):
         """View learned project insights"""
@@ -238,16 +261,12 @@ class MemoryLaneCLI:
             memories = learner.extract_from_text(args.text, source='manual')
             source = 'manual'
         else:
-            # Read from stdin (only if data is available)
-            import select
-            if select.select([sys.stdin], [], [], 0.0)[0]:
-                text = sys.stdin.read()
-                if text.strip():
-                    memories = learner.extract_from_text(text, source='stdin')
-                    source = 'stdin'
-                else:
-                    print("No input provided. Use --text, --transcript, or pipe text to stdin.")
-                    return
+            # Read from stdin only when piped (isatty avoids a select syscall
+            # and works on Windows)
+            text = '' if sys.stdin.isatty() else sys.stdin.read()
+            if text.strip():
+                memories = learner.extract_from_text(text, source='stdin')
+                source = 'stdin'
             else:
                 print("No input provided. Use --text, --transcript, or pipe text to stdin.")
                 return
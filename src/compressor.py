@@ -4,9 +4,21 @@ Compresses context from 20K tokens to ~3K tokens while preserving meaning
 """
 
 from typing import List, Dict, Set, Tuple
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+import io
+import hashlib
 import re
 
+# Optional: near-duplicate detection via MinHash-LSH
+try:
+    from datasketch import MinHash, MinHashLSH
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    DATASKETCH_AVAILABLE = False
+
 
 @dataclass
 class CompressedContext:
@@ -20,6 +32,64 @@ class CompressedContext:
     sections_removed: List[str]
 
 
+# Matches a run of non-whitespace, i.e. one word as str.split() sees it
+_WORD_RE = re.compile(r'\S+')
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token estimation (words * 1.3)"""
+    # Count word runs lazily instead of materializing a word list
+    words = sum(1 for _ in _WORD_RE.finditer(text))
+    return int(words * 1.3)
+
+
+@lru_cache(maxsize=128)
+def _parse_sections_cached(context: str) -> Tuple[Dict, ...]:
+    """Parse markdown-like sections (memoized on the raw text)"""
+    if not context:
+        return ()
+
+    # Header-free text: skip the line loop entirely and wrap the whole
+    # text in a single synthetic section
+    if not context.startswith('#') and '\n#' not in context:
+        return ({
+            'level': 0,
+            'title': '',
+            'content': context.splitlines(),
+            'tokens': _estimate_tokens(context)
+        },)
+
+    sections = []
+    current_section = None
+
+    for line in context.splitlines():
+        # Check for header
+        if line.startswith('#'):
+            if current_section:
+                sections.append(current_section)
+
+            level = len(line) - len(line.lstrip('#'))
+            title = line.lstrip('#').strip()
+
+            current_section = {
+                'level': level,
+                'title': title,
+                'content': [],
+                'tokens': 0
+            }
+        elif current_section:
+            current_section['content'].append(line)
+
+    if current_section:
+        sections.append(current_section)
+
+    # Calculate tokens for each section
+    for section in sections:
+        section['tokens'] = _estimate_tokens('\n'.join(section['content']))
+
+    return tuple(sections)
+
+
 class ContextCompressor:
     """
     Compresses context using multiple strategies:
@@ -29,13 +99,22 @@ class ContextCompressor:
     4. Structural optimization - Remove redundant formatting
     """
 
+    # Keywords that mark a section as important, matched in one pass
+    IMPORTANT_KEYWORDS = [
+        'pattern', 'insight', 'learning', 'error', 'important',
+        'note', 'warning', 'todo', 'api', 'authentication',
+        'database', 'configuration', 'deployment'
+    ]
+    _KEYWORD_RE = re.compile('|'.join(IMPORTANT_KEYWORDS))
+
     def __init__(self, target_tokens: int = 2000):
         self.target_tokens = target_tokens
+        self._searcher = None
+        self._searcher_checked = False
 
     def estimate_tokens(self, text: str) -> int:
         """Rough token estimation (words * 1.3)"""
-        words = len(text.split())
-        return int(words * 1.3)
+        return _estimate_tokens(text)
 
     def compress(self, context: str, preserve_sections: List[str] = None) -> CompressedContext:
         """
@@ -64,18 +143,14 @@ class ContextCompressor:
         # Step 2: Deduplicate
         sections = self._deduplicate_sections(sections)
 
-        # Step 3: Rank by importance
-        ranked_sections = self._rank_sections(sections, preserve_sections)
-
-        # Step 4: Select sections to keep within token budget
-        kept_sections, removed_sections = self._select_sections(
-            ranked_sections,
-            self.target_tokens
+        # Steps 3-5: Rank, select within budget and reconstruct in a
+        # single pass over the sections
+        compressed_text, kept_sections, removed_sections = self._rank_select_reconstruct(
+            sections,
+            self.target_tokens,
+            preserve_sections
         )
 
-        # Step 5: Reconstruct compressed text
-        compressed_text = self._reconstruct(kept_sections)
-
         compressed_tokens = self.estimate_tokens(compressed_text)
         compression_ratio = original_tokens / compressed_tokens if compressed_tokens > 0 else 1.0
 
@@ -91,61 +166,61 @@ class ContextCompressor:
 
     def _parse_sections(self, context: str) -> List[Dict]:
         """Parse markdown-like sections"""
-        sections = []
-        current_section = None
-
-        for line in context.split('\n'):
-            # Check for header
-            if line.startswith('#'):
-                if current_section:
-                    sections.append(current_section)
-
-                level = len(line) - len(line.lstrip('#'))
-                title = line.lstrip('#').strip()
-
-                current_section = {
-                    'level': level,
-                    'title': title,
-                    'content': [],
-                    'tokens': 0
-                }
-            elif current_section:
-                current_section['content'].append(line)
-
-        if current_section:
-            sections.append(current_section)
-
-        # Calculate tokens for each section
-        for section in sections:
-            section['tokens'] = self.estimate_tokens('\n'.join(section['content']))
-
-        return sections
+        # Parsing is stateless, so identical inputs (repeated compressions,
+        # shared fixtures) hit the module-level cache. Copy the cached
+        # sections so callers can annotate and mutate them freely.
+        return [dict(section, content=list(section['content']))
+                for section in _parse_sections_cached(context)]
 
-    def _deduplicate_sections(self, sections: List[Dict]) -> List[Dict]:
+    def _deduplicate_sections(self, sections: List[Dict], near_dup: bool = True) -> List[Dict]:
         """Remove duplicate or near-duplicate sections"""
         seen_content = set()
         deduplicated = []
 
-        for section in sections:
+        # Near-dup detection needs datasketch; without it we fall back to
+        # exact fingerprint matching only
+        lsh = None
+        if near_dup and DATASKETCH_AVAILABLE:
+            lsh = MinHashLSH(threshold=0.85, num_perm=64)
+
+        for i, section in enumerate(sections):
             # Create content signature
             content_str = '\n'.join(section['content']).lower()
             content_sig = self._create_signature(content_str)
 
-            if content_sig not in seen_content:
-                seen_content.add(content_sig)
-                deduplicated.append(section)
+            if content_sig in seen_content:
+                continue
+
+            if lsh is not None:
+                minhash = self._create_minhash(content_str)
+                if lsh.query(minhash):
+                    continue
+                lsh.insert(str(i), minhash)
+
+            seen_content.add(content_sig)
+            deduplicated.append(section)
 
         return deduplicated
 
-    def _create_signature(self, text: str) -> str:
+    def _create_minhash(self, text: str):
+        """Build a 64-permutation MinHash over word 5-grams"""
+        minhash = MinHash(num_perm=64)
+        tokens = re.findall(r'[a-z0-9]+', text)
+        for start in range(max(len(tokens) - 4, 1)):
+            shingle = ' '.join(tokens[start:start + 5])
+            minhash.update(shingle.encode('utf-8'))
+        return minhash
+
+    def _create_signature(self, text: str) -> bytes:
         """Create a signature for deduplication"""
         # Remove whitespace and normalize
         normalized = re.sub(r'\s+', ' ', text.lower().strip())
-        # Take first 100 chars as signature
-        return normalized[:100]
+        # Full-content fingerprint: no collisions between sections that
+        # merely share a common prefix
+        return hashlib.sha256(normalized.encode('utf-8')).digest()
 
-    def _rank_sections(self, sections: List[Dict], preserve: List[str]) -> List[Dict]:
-        """Rank sections by importance"""
+    def _rank_sections(self, sections: List[Dict], preserve: List[str], alpha: float = 1.0) -> List[Dict]:
+        """Rank sections by importance, structural rank and anchor distance"""
         for section in sections:
             score = 0.5  # Base score
 
@@ -155,16 +230,9 @@ class ContextCompressor:
             if section['title'] in preserve:
                 score += 1.0
 
-            # Boost sections with important keywords
-            important_keywords = [
-                'pattern', 'insight', 'learning', 'error', 'important',
-                'note', 'warning', 'todo', 'api', 'authentication',
-                'database', 'configuration', 'deployment'
-            ]
-
-            for keyword in important_keywords:
-                if keyword in title:
-                    score += 0.3
+            # Boost sections with important keywords, all matched in a
+            # single scan of the title
+            score += 0.3 * len(set(self._KEYWORD_RE.findall(title)))
 
             # Boost sections with content
             content_str = '\n'.join(section['content'])
@@ -181,8 +249,95 @@ class ContextCompressor:
 
             section['importance_score'] = score
 
-        # Sort by importance
-        return sorted(sections, key=lambda s: s['importance_score'], reverse=True)
+        # Combine importance with structural rank (H1 > H2 > H3) and,
+        # when semantic search is installed, distance to the preserved
+        # anchor sections
+        anchor = self._anchor_embedding(preserve)
+        for section in sections:
+            level = max(section['level'], 1)
+            distance = 1.0
+            if anchor is not None:
+                section_text = section['title'] + '\n' + '\n'.join(section['content'])
+                similarity = self._searcher.similarity(
+                    self._searcher.embed(section_text), anchor
+                )
+                distance = max(1.0 - similarity, 0.01)
+            section['priority'] = section['importance_score'] / (level * distance ** alpha)
+
+        # Sort by combined priority
+        return sorted(sections, key=lambda s: s['priority'], reverse=True)
+
+    def _anchor_embedding(self, preserve: List[str]):
+        """Embedding for the preserve-list anchors, or None without semantic search"""
+        if not preserve:
+            return None
+
+        if not self._searcher_checked:
+            self._searcher_checked = True
+            # Try semantic search if available
+            try:
+                from semantic_search import SemanticSearcher
+                self._searcher = SemanticSearcher()
+            except ImportError:
+                self._searcher = None
+
+        if self._searcher is None:
+            return None
+
+        return self._searcher.embed(' '.join(preserve))
+
+    def _rank_select_reconstruct(
+        self,
+        sections: List[Dict],
+        target_tokens: int,
+        preserve: List[str]
+    ) -> Tuple[str, List[Dict], List[Dict]]:
+        """Rank, select and rebuild text in one walk over the sections
+
+        Fuses _select_sections and _reconstruct: each kept section is
+        streamed into a StringIO buffer the moment it clears the budget
+        check, instead of walking the list again to join the text. The
+        individual steps remain available for direct use and testing.
+        """
+        ranked = self._rank_sections(sections, preserve)
+
+        buffer = io.StringIO()
+        kept = []
+        removed = []
+        current_tokens = 0
+
+        for section in ranked:
+            section_tokens = section['tokens']
+
+            if current_tokens + section_tokens > target_tokens:
+                # Keep high-importance sections in summarized form if
+                # the summary fits
+                summarized = None
+                if section['importance_score'] > 0.7:
+                    candidate = self._summarize_section(section)
+                    if current_tokens + candidate['tokens'] <= target_tokens:
+                        summarized = candidate
+
+                if summarized is None:
+                    removed.append(section)
+                    continue
+
+                section = summarized
+                section_tokens = summarized['tokens']
+
+            # Stream the section into the output buffer (same layout as
+            # _reconstruct)
+            if kept:
+                buffer.write('\n')
+            if section['level'] > 0:
+                buffer.write('#' * section['level'] + ' ' + section['title'] + '\n\n')
+            for line in section['content']:
+                buffer.write(line + '\n')
+
+            kept.append(section)
+            current_tokens += section_tokens
+
+        return buffer.getvalue(), kept, removed
 
     def _select_sections(
         self,
@@ -190,11 +345,19 @@ class ContextCompressor:
         target_tokens: int
     ) -> Tuple[List[Dict], List[Dict]]:
         """Select sections to keep within token budget"""
-        kept = []
         removed = []
-        current_tokens = 0
 
-        for section in ranked_sections:
+        # The top-ranked sections that fit entirely within budget form a
+        # prefix; find it with one cumulative sum and a bisect instead of
+        # accumulating per section
+        cumulative = list(accumulate(s['tokens'] for s in ranked_sections))
+        cut = bisect_right(cumulative, target_tokens)
+        kept = ranked_sections[:cut]
+        current_tokens = cumulative[cut - 1] if cut else 0
+
+        # Greedy fallback for the tail: smaller or summarizable sections
+        # may still fit
+        for section in ranked_sections[cut:]:
             section_tokens = section['tokens']
 
             if current_tokens + section_tokens <= target_tokens:
@@ -237,10 +400,11 @@ class ContextCompressor:
         lines = []
 
         for section in sections:
-            # Add header
-            header = '#' * section['level'] + ' ' + section['title']
-            lines.append(header)
-            lines.append('')
+            # Add header (synthetic header-free sections have level 0)
+            if section['level'] > 0:
+                header = '#' * section['level'] + ' ' + section['title']
+                lines.append(header)
+                lines.append('')
 
             # Add content
             lines.extend(section['content'])
@@ -151,6 +151,9 @@ class ConfigManager:
         self.config = self.load()
         self.setup_directories()
 
+        # Memoized get_path results; cleared whenever config changes
+        self._path_cache: Dict[str, Path] = {}
+
     def _find_config_file(self) -> Path:
         """Find configuration file in standard locations"""
         # Check in order:
@@ -240,6 +243,7 @@ class ConfigManager:
 
         # Set the value
         config[keys[-1]] = value
+        self._path_cache.clear()
         self.save()
 
     def setup_directories(self):
@@ -264,8 +268,14 @@ class ConfigManager:
         return False
 
     def get_path(self, path_key: str) -> Path:
-        """Get a configured path as a Path object"""
+        """Get a configured path as a Path object (memoized per key)"""
+        cached = self._path_cache.get(path_key)
+        if cached is not None:
+            return cached
+
         path_value = self.get(f'paths.{path_key}')
         if path_value:
-            return Path(path_value)
+            path = Path(path_value)
+            self._path_cache[path_key] = path
+            return path
         raise ValueError(f"Path not configured: {path_key}")
@@ -13,6 +13,24 @@ from pathlib import Path
 
 from summarizer import SummarizerService
 
+# Optional: google-re2 compiles patterns to a linear-time DFA (no backtracking).
+# Falls back to stdlib re when not installed or when a pattern uses features
+# re2 does not support.
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+
+def _compile_pattern(pattern: str):
+    """Compile with re2 when available, falling back to stdlib re."""
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, _re2.IGNORECASE)
+        except Exception:
+            pass
+    return re.compile(pattern, re.IGNORECASE)
+
 
 @dataclass
 class ExtractedMemory:
@@ -69,6 +87,9 @@ class ConversationLearner:
         (r'(?:stored|saved|located)\s+(?:in|at)\s+([^\s]+)', 'context', 0.7),
     ]
 
+    # Compiled once at import so the hot extraction loop skips pattern parsing
+    INSIGHT_PATTERNS = [(_compile_pattern(p), c, s) for p, c, s in INSIGHT_PATTERNS]
+
     # Keywords that boost relevance
     HIGH_VALUE_KEYWORDS = {
         'critical', 'important', 'always', 'never', 'must', 'required',
@@ -134,6 +155,8 @@ class ConversationLearner:
         (r'(?:the\s+)?(?:fix|solution|answer)\s+(?:was|is)\s+to\s+(.{10,100})', 'learnings', 0.95),
     ]
 
+    STRUCTURE_PATTERNS = [(_compile_pattern(p), c, s) for p, c, s in STRUCTURE_PATTERNS]
+
     # ==================== STRATEGY 4: Semantic Indicators ====================
 
     # Words that indicate different types of learnable content
@@ -162,6 +185,8 @@ class ConversationLearner:
         (r'(?:core\s+)?(?:idea|purpose|goal)\s*(?:is|:)\s*(.{15,120})', 'insights', 0.85),
     ]
 
+    DESCRIPTION_PATTERNS = [(_compile_pattern(p), c, s) for p, c, s in DESCRIPTION_PATTERNS]
+
     # Minimum indicator score to consider a sentence learnable (0-1 scale)
     SEMANTIC_THRESHOLD = 0.35
 
@@ -275,6 +300,11 @@ class ConversationLearner:
             if cleaned is None:
                 continue
 
+            # Model output is untrusted: null or a bare string here would
+            # crash or explode into characters under a plain list() call
+            tags = entry.get("tags", [])
+            tags = list(tags) if isinstance(tags, (list, tuple)) else []
+
             relevance = max(0.5, min(1.0, float(confidence)))
             memories.append(ExtractedMemory(
                 content=cleaned,
@@ -284,7 +314,7 @@ class ConversationLearner:
                 strategy="llm",
                 metadata={
                     "llm_type": entry_type,
-                    "tags": entry.get("tags", []),
+                    "tags": tags,
                 },
             ))
 
@@ -295,7 +325,7 @@ class ConversationLearner:
         memories = []
 
         for pattern, category, base_score in self.INSIGHT_PATTERNS:
-            match = re.search(pattern, sentence, re.IGNORECASE)
+            match = pattern.search(sentence)
             if match:
                 content = self._clean_content(sentence)
                 if content is None:
@@ -365,7 +395,7 @@ class ConversationLearner:
         memories = []
 
         for pattern, category, base_score in self.STRUCTURE_PATTERNS:
-            match = re.search(pattern, sentence, re.IGNORECASE)
+            match = pattern.search(sentence)
             if match:
                 content = self._clean_content(sentence)
                 if content is None:
@@ -449,7 +479,7 @@ class ConversationLearner:
         memories = []
 
         for pattern, category, base_score in self.DESCRIPTION_PATTERNS:
-            match = re.search(pattern, sentence, re.IGNORECASE)
+            match = pattern.search(sentence)
             if match:
                 content = self._clean_content(sentence)
                 if content is None:
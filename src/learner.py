@@ -3,6 +3,7 @@ Passive Learning Layer for MemoryLane
 Watches file changes, git commits, and learns from patterns
 """
 
+import logging
 import os
 import subprocess
 import time
@@ -14,6 +15,8 @@ from dataclasses import dataclass
 from config_manager import ConfigManager
 from memory_store import MemoryStore
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class FileChange:
@@ -39,6 +42,9 @@ class GitCommit:
 class GitParser:
     """Parse git history to learn project patterns"""
 
+    # Framework/library names matched against commit messages
+    FRAMEWORKS = ['react', 'vue', 'django', 'flask', 'fastapi', 'express', 'next.js']
+
     def __init__(self, repo_path: str = "."):
         self.repo_path = Path(repo_path)
 
@@ -142,8 +148,7 @@ class GitParser:
             msg = commit.message.lower()
 
             # Pattern: Framework/library mentions
-            frameworks = ['react', 'vue', 'django', 'flask', 'fastapi', 'express', 'next.js']
-            for fw in frameworks:
+            for fw in self.FRAMEWORKS:
                 if fw in msg:
                     patterns.append(f"Project uses {fw}")
 
@@ -175,10 +180,10 @@ class GitParser:
 class FileWatcher:
     """Watch file changes in the workspace"""
 
-    def __init__(self, config: ConfigManager):
+    def __init__(self, config: ConfigManager, workspace_root: Optional[Path] = None):
         self.config = config
         self.watched_files: Dict[str, float] = {}  # path -> last_modified
-        self.workspace_root = Path.cwd()
+        self.workspace_root = workspace_root if workspace_root is not None else Path.cwd()
 
     def scan_workspace(self, extensions: Optional[List[str]] = None) -> List[Path]:
         """Scan workspace for relevant files"""
@@ -262,13 +267,13 @@ class PassiveLearner:
 
     def initial_learning(self):
         """Perform initial learning from git history and workspace"""
-        print("🧠 MemoryLane: Initial learning...")
+        logger.info("🧠 MemoryLane: Initial learning...")
 
         # Learn from git history
         if self.config.get('learning.watch_git_commits', True):
             commits = self.git_parser.get_recent_commits(count=20)
             if commits:
-                print(f"  📚 Analyzing {len(commits)} recent commits...")
+                logger.info("  📚 Analyzing %d recent commits...", len(commits))
 
                 # Extract patterns
                 patterns = self.git_parser.extract_patterns(commits)
@@ -281,12 +286,12 @@ class PassiveLearner:
                         relevance_score=0.8
                     )
 
-                print(f"  ✓ Learned {len(patterns)} patterns from git history")
+                logger.info("  ✓ Learned %d patterns from git history", len(patterns))
 
         # Index workspace structure
         if self.config.get('learning.index_on_startup', True):
             files = self.file_watcher.scan_workspace()
-            print(f"  📂 Indexed {len(files)} files in workspace")
+            logger.info("  📂 Indexed %d files in workspace", len(files))
 
             # Learn project structure
             directories = set()
@@ -305,11 +310,11 @@ class PassiveLearner:
                         relevance_score=0.7
                     )
 
-        print("  ✓ Initial learning complete")
+        logger.info("  ✓ Initial learning complete")
 
     def watch_and_learn(self, interval: int = 30):
         """Continuous learning loop (runs in background)"""
-        print(f"👀 Watching for changes (checking every {interval}s)...")
+        logger.info("👀 Watching for changes (checking every %ds)...", interval)
 
         while True:
             try:
@@ -347,10 +352,10 @@ class PassiveLearner:
                 time.sleep(interval)
 
             except KeyboardInterrupt:
-                print("\n👋 Stopping learning...")
+                logger.info("\n👋 Stopping learning...")
                 break
             except Exception as e:
-                print(f"⚠️  Learning error: {e}")
+                logger.warning("⚠️  Learning error: %s", e)
                 time.sleep(interval)
 
 
@@ -358,6 +363,9 @@ def main():
     """CLI for testing learner"""
     import argparse
 
+    # Progress output goes through logging; surface it on the CLI
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     parser = argparse.ArgumentParser(description='MemoryLane Learner')
     parser.add_argument(
         'command',
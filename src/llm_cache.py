@@ -0,0 +1,42 @@
+"""
+Content-addressable cache for LLM responses.
+
+Stores one JSON blob per unique request digest so repeated extraction of
+identical transcripts skips the network/CLI roundtrip entirely.
+"""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+
+class LLMCache:
+    """
+    Simple filesystem cache keyed by content digest.
+
+    Each entry lives at cache_dir/{sha256}.json. Reads and writes are
+    best-effort: a corrupt or unreadable entry behaves like a miss.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on miss."""
+        entry = self.cache_dir / f"{key}.json"
+        try:
+            with open(entry, "r") as f:
+                return json.load(f)["response"]
+        except (OSError, json.JSONDecodeError, KeyError, TypeError):
+            # TypeError: valid JSON that isn't a dict (e.g. a bare list)
+            return None
+
+    def set(self, key: str, value: str):
+        """Store a response under key (best-effort)."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entry = self.cache_dir / f"{key}.json"
+            with open(entry, "w") as f:
+                json.dump({"response": value}, f)
+        except OSError:
+            pass
@@ -4,11 +4,19 @@ Adapted from ace-system-skill playbook_manager.py pattern
 """
 
 import json
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 
+# Optional: orjson serializes/deserializes large stores several times faster
+# than stdlib json. Backup/restore falls back to json when not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 @dataclass
 class Memory:
@@ -38,19 +46,43 @@ class MemoryStore:
         self.memory_path = Path(memory_path)
         self.memory_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Inverted token index for search(), built lazily and dropped on save
+        self._search_index = None
+
+        # Parsed-file cache keyed on mtime so repeated load() calls don't
+        # reparse an unchanged file (external writers bump the mtime and
+        # invalidate naturally)
+        self._data_cache = None
+        self._cache_mtime = None
+
     def load(self) -> Dict:
-        """Load memories from JSON file"""
+        """Load memories from JSON file
+
+        Returns the cached parse when the file is unchanged; callers
+        that mutate the result must save() it back.
+        """
         if not self.memory_path.exists():
             return self.create_empty_memory()
 
+        mtime = self.memory_path.stat().st_mtime_ns
+        if self._data_cache is not None and self._cache_mtime == mtime:
+            return self._data_cache
+
         try:
             with open(self.memory_path, 'r') as f:
-                return json.load(f)
+                memory_data = json.load(f)
         except json.JSONDecodeError:
             print(f"Warning: Corrupted memory file, creating backup and starting fresh")
             self._backup_corrupted()
             return self.create_empty_memory()
 
+        self._data_cache = memory_data
+        self._cache_mtime = mtime
+
+        # File changed on disk - the search index no longer matches
+        self._search_index = None
+        return memory_data
+
     def save(self, memory_data: Dict):
         """Save memories to JSON file"""
         memory_data['last_updated'] = datetime.now().isoformat()
@@ -58,6 +90,13 @@ class MemoryStore:
         with open(self.memory_path, 'w') as f:
             json.dump(memory_data, f, indent=2)
 
+        # The just-written data becomes the cached parse
+        self._data_cache = memory_data
+        self._cache_mtime = self.memory_path.stat().st_mtime_ns
+
+        # Contents changed - rebuild the search index on next search()
+        self._search_index = None
+
     def create_empty_memory(self) -> Dict:
         """Create empty memory structure"""
         return {
@@ -97,7 +136,55 @@ class MemoryStore:
     ) -> str:
         """Add a new memory to the specified category"""
         memory_data = self.load()
+        memory_id = self._append_memory(
+            memory_data, category, content, source, relevance_score, metadata
+        )
+        self.save(memory_data)
+        return memory_id
+
+    def add_memories_bulk(self, entries: List[Dict]) -> List[str]:
+        """Add several memories with a single load and save
+
+        Each entry is a dict with 'category', 'content' and 'source'
+        keys plus optional 'relevance_score' and 'metadata'. The whole
+        batch is serialized to disk once instead of once per memory.
+        """
+        memory_data = self.load()
+
+        # Validate the whole batch up front: load() returns the cached
+        # dict, so a mid-batch failure would otherwise leave the earlier
+        # entries sitting unsaved in the cache until some later save()
+        for entry in entries:
+            for key in ('category', 'content', 'source'):
+                if key not in entry:
+                    raise ValueError(f"Entry missing required key: {key}")
+            if entry['category'] not in memory_data['categories']:
+                raise ValueError(f"Invalid category: {entry['category']}")
+
+        memory_ids = [
+            self._append_memory(
+                memory_data,
+                entry['category'],
+                entry['content'],
+                entry['source'],
+                entry.get('relevance_score', 1.0),
+                entry.get('metadata')
+            )
+            for entry in entries
+        ]
+        self.save(memory_data)
+        return memory_ids
 
+    def _append_memory(
+        self,
+        memory_data: Dict,
+        category: str,
+        content: str,
+        source: str,
+        relevance_score: float = 1.0,
+        metadata: Optional[Dict] = None
+    ) -> str:
+        """Append one memory to in-memory state without saving"""
         if category not in memory_data['categories']:
             raise ValueError(f"Invalid category: {category}")
 
@@ -134,7 +221,6 @@ class MemoryStore:
         memory_data['categories'][category].append(asdict(memory))
         memory_data['metadata']['total_memories'] += 1
 
-        self.save(memory_data)
         return memory_id
 
     def get_memories(
@@ -166,6 +252,64 @@ class MemoryStore:
 
         return filtered
 
+    def _build_search_index(self):
+        """Build an inverted token index over all memory contents."""
+        index: Dict[str, set] = {}
+        by_id: Dict[str, Dict] = {}
+
+        for memory in self.get_memories():
+            by_id[memory['id']] = memory
+            for token in set(re.findall(r'\w+', memory['content'].lower())):
+                index.setdefault(token, set()).add(memory['id'])
+
+        self._search_index = (index, by_id)
+        return self._search_index
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Search memories by query using an inverted token index.
+
+        Intersects posting lists for each query token instead of scanning
+        every memory's content. Falls back to a substring scan when tokens
+        don't match exactly (e.g. partial-word queries).
+
+        Args:
+            query: Search query
+            limit: Maximum number of results
+
+        Returns:
+            Matching memories sorted by relevance score (descending)
+        """
+        tokens = re.findall(r'\w+', query.lower())
+        if not tokens:
+            return []
+
+        index, by_id = self._search_index or self._build_search_index()
+
+        posting: Optional[set] = None
+        for token in tokens:
+            ids = index.get(token, set())
+            posting = set(ids) if posting is None else posting & ids
+            if not posting:
+                break
+
+        if posting:
+            matches = [by_id[memory_id] for memory_id in posting]
+        else:
+            # Partial-word queries miss the token index; keep old behavior
+            query_lower = query.lower()
+            matches = [
+                m for m in by_id.values()
+                if query_lower in m['content'].lower()
+            ]
+
+        matches.sort(key=lambda m: m['relevance_score'], reverse=True)
+
+        if limit:
+            matches = matches[:limit]
+
+        return matches
+
     def update_memory_usage(self, memory_id: str):
         """Update usage statistics for a memory"""
         memory_data = self.load()
@@ -250,16 +394,17 @@ class MemoryStore:
         }
 
         for category, memories in memory_data['categories'].items():
-            if memories:
-                avg_relevance = sum(m['relevance_score'] for m in memories) / len(memories)
-                total_usage = sum(m['usage_count'] for m in memories)
-            else:
-                avg_relevance = 0.0
-                total_usage = 0
+            # Single pass per category: accumulate relevance and usage together
+            count = len(memories)
+            relevance_sum = 0.0
+            total_usage = 0
+            for m in memories:
+                relevance_sum += m['relevance_score']
+                total_usage += m['usage_count']
 
             stats['categories'][category] = {
-                "count": len(memories),
-                "avg_relevance": round(avg_relevance, 2),
+                "count": count,
+                "avg_relevance": round(relevance_sum / count, 2) if count else 0.0,
                 "total_usage": total_usage
             }
 
@@ -282,15 +427,23 @@ class MemoryStore:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             backup_path = backup_dir / f"memories.{timestamp}.json"
 
-        with open(backup_path, 'w') as f:
-            json.dump(memory_data, f, indent=2)
+        if orjson is not None:
+            Path(backup_path).write_bytes(
+                orjson.dumps(memory_data, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open(backup_path, 'w') as f:
+                json.dump(memory_data, f, indent=2)
 
         return backup_path
 
     def import_backup(self, backup_path: Path):
         """Restore memories from a backup"""
-        with open(backup_path, 'r') as f:
-            memory_data = json.load(f)
+        if orjson is not None:
+            memory_data = orjson.loads(Path(backup_path).read_bytes())
+        else:
+            with open(backup_path, 'r') as f:
+                memory_data = json.load(f)
 
         # Create backup of current state first
         self.export_backup()
@@ -61,6 +61,30 @@ class SemanticSearcher:
 
         return dot_product / (norm1 * norm2)
 
+    def similarity_batch(
+        self,
+        embeddings1: List[List[float]],
+        embeddings2: List[List[float]]
+    ) -> List[float]:
+        """
+        Cosine similarity for aligned batches of embedding pairs.
+
+        Uses numpy when available (it ships alongside sentence-transformers),
+        falling back to per-pair similarity() otherwise.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return [self.similarity(a, b) for a, b in zip(embeddings1, embeddings2)]
+
+        a = np.asarray(embeddings1, dtype=np.float32)
+        b = np.asarray(embeddings2, dtype=np.float32)
+        dots = np.einsum('ij,ij->i', a, b)
+        norms = np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = np.where(norms == 0, 0.0, dots / norms)
+        return scores.tolist()
+
     def search(
         self,
         query: str,
@@ -9,7 +9,11 @@ import sys
 import json
 import socket
 import signal
+import struct
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
@@ -17,6 +21,98 @@ from typing import Dict, Any, Optional
 from memory_store import MemoryStore
 from config_manager import ConfigManager
 
+# Optional: orjson encodes/decodes request payloads several times faster
+# than the stdlib json module. Falls back to json if not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_payload(obj: Dict[str, Any]) -> bytes:
+    """Serialize a request/response dict to bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _decode_payload(data) -> Dict[str, Any]:
+    """Deserialize a request/response dict from a bytes-like object"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(str(data, 'utf-8'))
+
+
+# Wire format: a 4-byte big-endian length prefix followed by the JSON
+# payload. Fixed-size framing avoids scanning received chunks for a
+# delimiter and supports payloads that contain newlines.
+_LEN_PREFIX = struct.Struct('!I')
+
+
+def _send_frame(sock: socket.socket, payload: bytes) -> None:
+    """Send one length-prefixed frame"""
+    sock.sendall(_LEN_PREFIX.pack(len(payload)) + payload)
+
+
+# Preallocated receive buffers are this large; frames that fit are read
+# with recv_into and no per-request allocation.
+_RECV_BUF_SIZE = 65536
+
+
+def _recv_exact(sock: socket.socket, count: int,
+                buf: Optional[bytearray] = None) -> Optional[memoryview]:
+    """Read exactly count bytes, or None if the peer closed early.
+
+    Receives into buf when given (it must hold count bytes), otherwise
+    into a fresh bytearray. Returns a memoryview over the bytes read.
+    """
+    if buf is None:
+        buf = bytearray(count)
+    view = memoryview(buf)[:count]
+    offset = 0
+    while offset < count:
+        received = sock.recv_into(view[offset:])
+        if not received:
+            return None
+        offset += received
+    return view
+
+
+def _recv_frame(sock: socket.socket,
+                buf: Optional[bytearray] = None) -> Optional[memoryview]:
+    """Receive one length-prefixed frame, or None on EOF"""
+    header = _recv_exact(sock, _LEN_PREFIX.size)
+    if header is None:
+        return None
+    (length,) = _LEN_PREFIX.unpack(header)
+    if buf is not None and length > len(buf):
+        buf = None  # Oversized frame: fall back to a dedicated buffer
+    return _recv_exact(sock, length, buf)
+
+
+def _recv_line(sock: socket.socket) -> Optional[bytes]:
+    """Receive one newline-terminated payload (legacy framing)"""
+    data = bytearray()
+    while True:
+        chunk = sock.recv(4096)
+        if not chunk:
+            return None
+        data += chunk
+        newline = data.find(b'\n')
+        if newline != -1:
+            return bytes(data[:newline])
+
+
+@dataclass
+class ServerStats:
+    """Fixed-field server counters; slots avoid a per-instance dict"""
+
+    __slots__ = ('started_at', 'requests_handled', 'errors')
+
+    started_at: str
+    requests_handled: int
+    errors: int
+
 
 class MemoryLaneServer:
     """
@@ -31,12 +127,35 @@ class MemoryLaneServer:
         self.pid_file = config.get_path('memory_dir') / "server.pid"
         self.running = False
         self.server_socket = None
+        self._start_monotonic = time.monotonic()
+
+        # Reused worker threads: avoids a Thread allocation per connection
+        self._pool = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 4) * 2),
+            thread_name_prefix='ml-worker'
+        )
+
+        # One receive buffer per pooled worker, allocated lazily and
+        # reused across every request that worker handles
+        self._recv_buffers = threading.local()
 
         # Statistics
-        self.stats = {
-            'started_at': datetime.now().isoformat(),
-            'requests_handled': 0,
-            'errors': 0
+        self.stats = ServerStats(
+            started_at=datetime.now().isoformat(),
+            requests_handled=0,
+            errors=0
+        )
+
+        # Action routing: one dict lookup instead of an if/elif ladder
+        self._action_handlers = {
+            'add_memory': self._handle_add_memory,
+            'get_memories': self._handle_get_memories,
+            'get_context': self._handle_get_context,
+            'update_usage': self._handle_update_usage,
+            'get_stats': self._handle_get_stats,
+            'prune': self._handle_prune,
+            'ping': self._handle_ping,
+            'shutdown': self._handle_shutdown,
         }
 
     def start(self):
@@ -86,52 +205,91 @@ class MemoryLaneServer:
         # Set permissions
         os.chmod(self.socket_path, 0o600)
 
+    # Socket buffer size covering the largest expected message, so short
+    # requests and responses complete without extra kernel round-trips
+    _SOCKET_BUF_SIZE = 262144
+
+    def _tune_client_socket(self, conn: socket.socket) -> bool:
+        """Tune an accepted connection; returns False to reject the peer"""
+        try:
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self._SOCKET_BUF_SIZE)
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self._SOCKET_BUF_SIZE)
+        except OSError:
+            pass  # Buffer sizing is best-effort
+
+        # Cheap peer auth on Linux: only the owning user may connect
+        # (the 0600 socket file already enforces this at connect time)
+        if hasattr(socket, 'SO_PEERCRED'):
+            try:
+                creds = conn.getsockopt(
+                    socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i')
+                )
+                _, uid, _ = struct.unpack('3i', creds)
+                if uid not in (os.getuid(), 0):
+                    return False
+            except OSError:
+                pass
+
+        return True
+
     def _listen(self):
         """Main server loop"""
         while self.running:
             try:
                 client_socket, _ = self.server_socket.accept()
 
-                # Handle request in thread for concurrency
-                thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket,)
-                )
-                thread.daemon = True
-                thread.start()
+                if not self._tune_client_socket(client_socket):
+                    client_socket.close()
+                    continue
+
+                # Handle request on a pooled worker for concurrency
+                self._pool.submit(self._handle_client, client_socket)
 
             except Exception as e:
                 if self.running:  # Only log if not shutting down
                     print(f"Error accepting connection: {e}")
-                    self.stats['errors'] += 1
+                    self.stats.errors += 1
+
+    def _get_recv_buffer(self) -> bytearray:
+        """Return the calling worker thread's reusable receive buffer"""
+        buf = getattr(self._recv_buffers, 'buf', None)
+        if buf is None:
+            buf = self._recv_buffers.buf = bytearray(_RECV_BUF_SIZE)
+        return buf
 
     def _handle_client(self, client_socket: socket.socket):
         """Handle a client request"""
+        legacy = False
         try:
-            # Read request (JSON)
-            data = b''
-            while True:
-                chunk = client_socket.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-                # Simple protocol: newline-terminated JSON
-                if b'\n' in chunk:
-                    break
-
-            if not data:
+            # The VS Code extension still speaks newline-delimited JSON.
+            # A length prefix for any frame under 16 MB starts with a nul
+            # byte — which never opens a JSON text, even with leading
+            # whitespace — so the first byte tells the two framings apart.
+            first = client_socket.recv(1, socket.MSG_PEEK)
+            if not first:
+                return
+            legacy = first != b'\x00'
+
+            if legacy:
+                data = _recv_line(client_socket)
+            else:
+                # Read into this worker's preallocated buffer
+                data = _recv_frame(client_socket, self._get_recv_buffer())
+            if data is None:
                 return
 
-            request = json.loads(data.decode('utf-8'))
+            request = _decode_payload(data)
 
             # Process request
             response = self._process_request(request)
 
-            # Send response
-            response_json = json.dumps(response) + '\n'
-            client_socket.sendall(response_json.encode('utf-8'))
+            # Send response in the framing the client used
+            if legacy:
+                client_socket.sendall(_encode_payload(response) + b'\n')
+            else:
+                _send_frame(client_socket, _encode_payload(response))
 
-            self.stats['requests_handled'] += 1
+            self.stats.requests_handled += 1
 
         except Exception as e:
             error_response = {
@@ -139,12 +297,13 @@ class MemoryLaneServer:
                 'error': str(e)
             }
             try:
-                client_socket.sendall(
-                    (json.dumps(error_response) + '\n').encode('utf-8')
-                )
+                if legacy:
+                    client_socket.sendall(_encode_payload(error_response) + b'\n')
+                else:
+                    _send_frame(client_socket, _encode_payload(error_response))
             except:
                 pass
-            self.stats['errors'] += 1
+            self.stats.errors += 1
 
         finally:
             client_socket.close()
@@ -152,85 +311,88 @@ class MemoryLaneServer:
     def _process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process a client request"""
         action = request.get('action')
+        handler = self._action_handlers.get(action)
 
-        if action == 'add_memory':
-            memory_id = self.store.add_memory(
-                category=request['category'],
-                content=request['content'],
-                source=request.get('source', 'unknown'),
-                relevance_score=request.get('relevance_score', 1.0),
-                metadata=request.get('metadata')
-            )
+        if handler is None:
             return {
-                'status': 'success',
-                'memory_id': memory_id
+                'status': 'error',
+                'error': f'Unknown action: {action}'
             }
 
-        elif action == 'get_memories':
-            memories = self.store.get_memories(
-                category=request.get('category'),
-                min_relevance=request.get('min_relevance', 0.0),
-                limit=request.get('limit')
-            )
-            return {
-                'status': 'success',
-                'memories': memories
-            }
+        return handler(request)
+
+    def _handle_add_memory(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        memory_id = self.store.add_memory(
+            category=request['category'],
+            content=request['content'],
+            source=request.get('source', 'unknown'),
+            relevance_score=request.get('relevance_score', 1.0),
+            metadata=request.get('metadata')
+        )
+        return {
+            'status': 'success',
+            'memory_id': memory_id
+        }
 
-        elif action == 'get_context':
-            # Get compressed context for injection
-            category = request.get('category')
-            markdown = self.store.to_markdown(category)
+    def _handle_get_memories(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        memories = self.store.get_memories(
+            category=request.get('category'),
+            min_relevance=request.get('min_relevance', 0.0),
+            limit=request.get('limit')
+        )
+        return {
+            'status': 'success',
+            'memories': memories
+        }
 
-            return {
-                'status': 'success',
-                'context': markdown,
-                'tokens': len(markdown.split())  # Rough estimate
-            }
+    def _handle_get_context(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        # Get compressed context for injection
+        category = request.get('category')
+        markdown = self.store.to_markdown(category)
 
-        elif action == 'update_usage':
-            self.store.update_memory_usage(request['memory_id'])
-            return {
-                'status': 'success'
-            }
+        return {
+            'status': 'success',
+            'context': markdown,
+            'tokens': len(markdown.split())  # Rough estimate
+        }
 
-        elif action == 'get_stats':
-            memory_stats = self.store.get_stats()
-            return {
-                'status': 'success',
-                'memory_stats': memory_stats,
-                'server_stats': self.stats
-            }
+    def _handle_update_usage(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        self.store.update_memory_usage(request['memory_id'])
+        return {
+            'status': 'success'
+        }
 
-        elif action == 'prune':
-            pruned = self.store.prune_low_relevance(
-                threshold=request.get('threshold', 0.3),
-                max_age_days=request.get('max_age_days', 30)
-            )
-            return {
-                'status': 'success',
-                'pruned_count': pruned
-            }
+    def _handle_get_stats(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        memory_stats = self.store.get_stats()
+        return {
+            'status': 'success',
+            'memory_stats': memory_stats,
+            'server_stats': asdict(self.stats)
+        }
 
-        elif action == 'ping':
-            return {
-                'status': 'success',
-                'message': 'pong',
-                'uptime': (datetime.now() - datetime.fromisoformat(self.stats['started_at'])).total_seconds()
-            }
+    def _handle_prune(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        pruned = self.store.prune_low_relevance(
+            threshold=request.get('threshold', 0.3),
+            max_age_days=request.get('max_age_days', 30)
+        )
+        return {
+            'status': 'success',
+            'pruned_count': pruned
+        }
 
-        elif action == 'shutdown':
-            self.stop()
-            return {
-                'status': 'success',
-                'message': 'shutting down'
-            }
+    def _handle_ping(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'status': 'success',
+            'message': 'pong',
+            'uptime': time.monotonic() - self._start_monotonic
+        }
 
-        else:
-            return {
-                'status': 'error',
-                'error': f'Unknown action: {action}'
-            }
+    def _handle_shutdown(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        self.stop()
+        return {
+            'status': 'success',
+            'message': 'shutting down'
+        }
 
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
@@ -241,6 +403,9 @@ class MemoryLaneServer:
         """Stop the server gracefully"""
         self.running = False
 
+        # Stop accepting work; in-flight requests finish on their workers
+        self._pool.shutdown(wait=False)
+
         # Close socket
         if self.server_socket:
             self.server_socket.close()
@@ -253,7 +418,7 @@ class MemoryLaneServer:
         if self.pid_file.exists():
             self.pid_file.unlink()
 
-        print(f"✓ Server stopped (handled {self.stats['requests_handled']} requests)")
+        print(f"✓ Server stopped (handled {self.stats.requests_handled} requests)")
         sys.exit(0)
 
 
@@ -273,20 +438,14 @@ class MemoryLaneClient:
             client_socket.connect(self.socket_path)
 
             # Send request
-            request_json = json.dumps(request) + '\n'
-            client_socket.sendall(request_json.encode('utf-8'))
+            _send_frame(client_socket, _encode_payload(request))
 
             # Receive response
-            data = b''
-            while True:
-                chunk = client_socket.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-                if b'\n' in chunk:
-                    break
-
-            response = json.loads(data.decode('utf-8'))
+            data = _recv_frame(client_socket)
+            if data is None:
+                raise ConnectionError("Server closed connection")
+
+            response = _decode_payload(data)
             client_socket.close()
 
             return response
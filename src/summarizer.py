@@ -7,12 +7,37 @@ from __future__ import annotations
 
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import chain
 from typing import Any, Dict, List, Optional
 
 from prompt_builder import PromptBuilder
 from model_manager import ModelManager
 
+# Optional: jsonschema checks model output in one precompiled pass.
+# Falls back to the manual key checks in _parse_output if not installed.
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+# Reused decoder for positional JSON extraction from model output
+_JSON_DECODER = json.JSONDecoder()
+
+_OUTPUT_SCHEMA = {
+    "type": "object",
+    "required": ["summary", "memory_entries"],
+    "properties": {
+        "memory_entries": {"type": "array"},
+        "suggested_deletions": {"type": "array"},
+    },
+}
+_OUTPUT_VALIDATOR = (
+    jsonschema.Draft202012Validator(_OUTPUT_SCHEMA) if jsonschema is not None else None
+)
+
 
 class SummarizerService:
     """Summarize session transcripts using a local LLM."""
@@ -50,23 +75,39 @@ class SummarizerService:
             return None
 
         chunks = self._chunk_text(raw_text)
-        results = []
-
-        for chunk in chunks:
-            payload = {
-                "session_id": str(uuid.uuid4()),
-                "timestamp": datetime.now().isoformat(),
-                "project_name": project_name or "",
-                "raw_transcript": chunk,
-                "context_hints": context_hints or [],
-            }
+        summarize = partial(
+            self._summarize_chunk,
+            project_name=project_name,
+            context_hints=context_hints,
+        )
 
-            result = self._summarize_payload(payload)
-            if result:
-                results.append(result)
+        # Chunks are independent, so they can be summarized concurrently
+        # when the backend tolerates it (disabled by default: the local
+        # transformers backend gains little under concurrent generate calls)
+        if len(chunks) > 1 and self._get_config_value("summarizer.parallel_chunks", False):
+            with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as executor:
+                results = [r for r in executor.map(summarize, chunks) if r]
+        else:
+            results = [r for r in map(summarize, chunks) if r]
 
         return self._merge_results(results)
 
+    def _summarize_chunk(
+        self,
+        chunk: str,
+        project_name: Optional[str] = None,
+        context_hints: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Summarize a single transcript chunk."""
+        payload = {
+            "session_id": str(uuid.uuid4()),
+            "timestamp": datetime.now().isoformat(),
+            "project_name": project_name or "",
+            "raw_transcript": chunk,
+            "context_hints": context_hints or [],
+        }
+        return self._summarize_payload(payload)
+
     def _summarize_payload(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Run a single summarization call."""
         model_bundle = self.model_manager.get_model_and_tokenizer()
@@ -139,12 +180,17 @@ class SummarizerService:
         if not payload:
             return None
 
-        if "summary" not in payload or "memory_entries" not in payload:
-            return None
-
-        if not isinstance(payload.get("memory_entries"), list):
+        # Coerce before validating so a non-list memory_entries is
+        # repaired rather than rejected
+        if not isinstance(payload.get("memory_entries", []), list):
             payload["memory_entries"] = []
 
+        if _OUTPUT_VALIDATOR is not None:
+            if not _OUTPUT_VALIDATOR.is_valid(payload):
+                return None
+        elif "summary" not in payload or "memory_entries" not in payload:
+            return None
+
         if "suggested_deletions" not in payload:
             payload["suggested_deletions"] = []
 
@@ -166,20 +212,21 @@ class SummarizerService:
                     lines = lines[:-1]
                 cleaned = "\n".join(lines).strip()
 
-        try:
-            return json.loads(cleaned)
-        except json.JSONDecodeError:
-            pass
-
+        # raw_decode parses from any offset and reports where it stopped,
+        # so a single forward scan over '{' positions replaces the old
+        # find/rfind slice-and-retry approach.
         start = cleaned.find("{")
-        end = cleaned.rfind("}")
-        if start == -1 or end == -1 or end <= start:
-            return None
+        while start != -1:
+            try:
+                payload, _ = _JSON_DECODER.raw_decode(cleaned, start)
+            except json.JSONDecodeError:
+                start = cleaned.find("{", start + 1)
+                continue
+            if isinstance(payload, dict):
+                return payload
+            start = cleaned.find("{", start + 1)
 
-        try:
-            return json.loads(cleaned[start:end + 1])
-        except json.JSONDecodeError:
-            return None
+        return None
 
     def _merge_results(self, results: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Merge multi-chunk results into a single response."""
@@ -189,21 +236,18 @@ class SummarizerService:
         if len(results) == 1:
             return results[0]
 
-        summary_parts = []
-        memory_entries: List[Dict[str, Any]] = []
-        suggested_deletions: List[str] = []
-
-        for result in results:
-            summary = result.get("summary", "").strip()
-            if summary:
-                summary_parts.append(summary)
-            memory_entries.extend(result.get("memory_entries", []))
-            suggested_deletions.extend(result.get("suggested_deletions", []))
-
-        combined_summary = " ".join(summary_parts).strip()
+        summary_parts = (result.get("summary", "").strip() for result in results)
+        combined_summary = " ".join(part for part in summary_parts if part)
         if combined_summary:
             combined_summary = self._trim_summary(combined_summary)
 
+        memory_entries = list(chain.from_iterable(
+            result.get("memory_entries", []) for result in results
+        ))
+        suggested_deletions = chain.from_iterable(
+            result.get("suggested_deletions", []) for result in results
+        )
+
         return {
             "summary": combined_summary,
             "memory_entries": self._dedupe_entries(memory_entries),
@@ -222,18 +266,14 @@ class SummarizerService:
 
     def _dedupe_entries(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Deduplicate memory entries by content."""
-        seen = set()
-        unique = []
+        # Insertion-ordered dict keyed on the signature: setdefault keeps
+        # the first entry per signature without a separate seen-set
+        seen: Dict[str, Dict[str, Any]] = {}
         for entry in entries:
             content = str(entry.get("content", "")).strip().lower()
-            if not content:
-                continue
-            sig = content[:80]
-            if sig in seen:
-                continue
-            seen.add(sig)
-            unique.append(entry)
-        return unique
+            if content:
+                seen.setdefault(content[:80], entry)
+        return list(seen.values())
 
     def _chunk_text(self, text: str) -> List[str]:
         """Chunk large transcripts to avoid context overflow."""
@@ -254,9 +294,28 @@ class SummarizerService:
 
         return chunks
 
-    def _estimate_tokens(self, text: str) -> int:
+    # Only strings this short are memoized: caching whole transcripts
+    # would pin up to 4096 megabyte-scale strings in the lru_cache and
+    # pay a full-string hash per lookup
+    _ESTIMATE_CACHE_MAX_CHARS = 2048
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
         """Rough token estimate using word count."""
-        return int(len(text.split()) * 1.3)
+        if not text:
+            return 0
+        if len(text) <= SummarizerService._ESTIMATE_CACHE_MAX_CHARS:
+            return SummarizerService._estimate_tokens_cached(text)
+        # Counting separators + 1 approximates the word count without
+        # materializing a list of substrings the way text.split() does.
+        # Newlines count too: transcripts are newline-heavy.
+        return (text.count(" ") + text.count("\n") + 1) * 13 // 10
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _estimate_tokens_cached(text: str) -> int:
+        """Memoized estimate for short, frequently repeated strings."""
+        return (text.count(" ") + text.count("\n") + 1) * 13 // 10
 
     def _get_config_value(self, key: str, default):
         if self.config is None:
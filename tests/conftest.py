@@ -2,9 +2,32 @@
 Pytest configuration and fixtures for MemoryLane tests.
 """
 
+import itertools
 import os
+
 import pytest
 
+# src/ is importable via `pythonpath = src` in pytest.ini, which pytest
+# applies before conftest import — no sys.path mutation needed here.
+from memory_store import MemoryStore
+
+
+@pytest.fixture(scope="module")
+def store_factory(tmp_path_factory):
+    """Hand out fresh MemoryStore files under one shared temp directory.
+
+    Creating one directory per module instead of one per test keeps
+    filesystem setup out of individual tests; each call still gets its
+    own empty store file.
+    """
+    base = tmp_path_factory.mktemp("stores")
+    counter = itertools.count()
+
+    def make():
+        return MemoryStore(str(base / f"store{next(counter)}.json"))
+
+    return make
+
 
 def is_ci():
     """Check if running in CI environment."""
@@ -41,3 +64,33 @@ def skip_in_ci():
     """Fixture to skip test if running in CI."""
     if is_ci():
         pytest.skip("Skipped in CI - requires local resources")
+
+
+@pytest.fixture
+def make_cli(tmp_path):
+    """
+    Factory for MemoryLaneCLI instances with the standard mock stack
+    (ConfigManager, MemoryStore, ProjectRegistry, ensure_registered).
+
+    Shares one patch stack per test instead of re-nesting four `with patch`
+    blocks in every fixture. Pass a `configure(mock_config, mock_store)`
+    callback to customize mock return values before construction.
+    """
+    from contextlib import ExitStack
+    from unittest.mock import patch
+
+    with ExitStack() as stack:
+        def _make(configure=None):
+            mock_config = stack.enter_context(patch('cli.ConfigManager'))
+            mock_store = stack.enter_context(patch('cli.MemoryStore'))
+            stack.enter_context(patch('cli.ProjectRegistry'))
+            stack.enter_context(patch('cli.ensure_registered'))
+
+            mock_config.return_value.get_path.return_value = tmp_path / "memories.json"
+            if configure:
+                configure(mock_config, mock_store)
+
+            from cli import MemoryLaneCLI
+            return MemoryLaneCLI(auto_register=False)
+
+        yield _make
@@ -2,15 +2,54 @@
 Tests for Claude-powered extraction with backend configuration and fallbacks.
 """
 
-from pathlib import Path
 import sys
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from claude_extractor import ClaudeExtractor, ExtractedMemory, _probe_api, _probe_cli
 
-from claude_extractor import ClaudeExtractor, ExtractedMemory
+# Shared response fixtures, built once at module load instead of per test
+_RESP_VALID_JSON = '''
+{
+    "memories": [
+        {"category": "patterns", "content": "Use async for I/O.", "relevance": 0.9, "tags": ["async"]}
+    ]
+}
+'''
+
+_RESP_MARKDOWN = '''```json
+{
+    "memories": [
+        {"category": "insights", "content": "This is a valid test insight memory.", "relevance": 0.8, "tags": []}
+    ]
+}
+```'''
+
+_RESP_MEMORY_ENTRIES = '''
+{
+    "memory_entries": [
+        {"category": "learnings", "content": "This is a valid test learning memory.", "relevance": 0.75, "tags": []}
+    ]
+}
+'''
+
+_RESP_SHORT_CONTENT = '''
+{
+    "memories": [
+        {"category": "patterns", "content": "Short.", "relevance": 0.9, "tags": []},
+        {"category": "patterns", "content": "This is a longer valid memory.", "relevance": 0.9, "tags": []}
+    ]
+}
+'''
+
+_RESP_INVALID_CATEGORY = '''
+{
+    "memories": [
+        {"category": "unknown_category", "content": "Test with invalid category here.", "relevance": 0.8, "tags": []}
+    ]
+}
+'''
 
 
 class TestClaudeExtractorBackendConfig:
@@ -100,6 +139,25 @@ class TestBackendSelection:
                 # Should return empty list
                 assert memories == []
 
+    def test_extract_empty_returns_immediately(self):
+        """Empty or whitespace-only input never dispatches to a backend."""
+        extractor = ClaudeExtractor()
+
+        with patch.object(extractor, '_call_claude') as mock_claude:
+            assert extractor.extract('') == []
+            assert extractor.extract('   \n') == []
+
+            mock_claude.assert_not_called()
+
+    def test_regex_backend_does_not_import_anthropic(self, sample_text):
+        """Regex extraction never pulls in the heavy anthropic SDK."""
+        config = {"extraction": {"backend": "regex"}}
+        extractor = ClaudeExtractor(config=config)
+
+        extractor.extract(sample_text)
+
+        assert 'anthropic' not in sys.modules
+
     def test_auto_backend_tries_all(self, sample_text):
         """When backend='auto', tries Claude then falls back."""
         config = {"extraction": {"backend": "auto"}}
@@ -139,6 +197,51 @@ class TestFallbackChain:
             assert len(memories) == 1
             assert memories[0].content == "This is a valid test pattern memory."
 
+    def test_claude_cache_hit_skips_call(self, sample_text, tmp_path):
+        """Second extraction of identical input is served from the cache."""
+        config = {"extraction": {"cache_dir": str(tmp_path / "llm_cache")}}
+        extractor = ClaudeExtractor(config=config)
+        extractor._cli_available = True
+
+        mock_response = '{"memories": [{"category": "patterns", "content": "This is a valid test pattern memory.", "relevance": 0.9, "tags": []}]}'
+
+        with patch.object(extractor, '_call_cli', return_value=mock_response) as mock_cli:
+            first = extractor.extract(sample_text)
+            second = extractor.extract(sample_text)
+
+            # Only the first call reaches the CLI; the second is a cache hit
+            mock_cli.assert_called_once()
+            assert len(first) == len(second) == 1
+            assert first[0].content == second[0].content
+
+    def test_cache_non_dict_entry_is_a_miss(self, tmp_path):
+        """Valid JSON that isn't a dict must behave like a miss."""
+        from llm_cache import LLMCache
+
+        cache = LLMCache(tmp_path / "llm_cache")
+        cache.set("key", "value")
+        (tmp_path / "llm_cache" / "key.json").write_text("[1]")
+
+        assert cache.get("key") is None
+
+    def test_claude_invalid_json_retries_with_feedback(self, sample_text):
+        """Unparseable output triggers a retry with the error fed back."""
+        extractor = ClaudeExtractor()
+
+        good_response = '{"memories": [{"category": "patterns", "content": "This is a valid test pattern memory.", "relevance": 0.9, "tags": []}]}'
+
+        with patch.object(
+            extractor, '_call_claude',
+            side_effect=['not valid json', good_response],
+        ) as mock_claude:
+            memories = extractor.extract(sample_text)
+
+            assert mock_claude.call_count == 2
+            assert len(memories) == 1
+            # The retry message carries the correction feedback
+            retry_message = mock_claude.call_args[0][1]
+            assert "could not be parsed" in retry_message
+
     def test_claude_fails_tries_local_llm(self, sample_text):
         """When Claude fails, local LLM is tried."""
         extractor = ClaudeExtractor()
@@ -204,43 +307,49 @@ class TestRegexExtraction:
 class TestCLIAndAPIAvailability:
     """Test CLI and API availability checks."""
 
-    def test_cli_availability_check(self):
+    @pytest.fixture(autouse=True)
+    def clear_probe_caches(self):
+        """Reset the process-level probe caches around each test.
+
+        Clearing after as well keeps results probed against this test's
+        monkeypatched environment from leaking into the rest of the run.
+        """
+        _probe_cli.cache_clear()
+        _probe_api.cache_clear()
+        yield
+        _probe_cli.cache_clear()
+        _probe_api.cache_clear()
+
+    def test_cli_availability_check(self, monkeypatch):
         """CLI availability is checked correctly."""
         extractor = ClaudeExtractor()
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            assert extractor.cli_available is True
+        monkeypatch.setattr('subprocess.run', lambda *a, **k: MagicMock(returncode=0))
+        assert extractor.cli_available is True
 
-    def test_cli_unavailable(self):
+    def test_cli_unavailable(self, monkeypatch):
         """CLI unavailable when command fails."""
         extractor = ClaudeExtractor()
-        extractor._cli_available = None  # Reset cache
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.side_effect = FileNotFoundError()
-            assert extractor.cli_available is False
+        def raise_not_found(*args, **kwargs):
+            raise FileNotFoundError()
+
+        monkeypatch.setattr('subprocess.run', raise_not_found)
+        assert extractor.cli_available is False
 
-    def test_api_available_with_key(self):
+    def test_api_available_with_key(self, monkeypatch):
         """API is available when ANTHROPIC_API_KEY is set."""
         extractor = ClaudeExtractor()
-        extractor._api_available = None  # Reset cache
 
-        with patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'}):
-            assert extractor.api_available is True
+        monkeypatch.setenv('ANTHROPIC_API_KEY', 'test-key')
+        assert extractor.api_available is True
 
-    def test_api_unavailable_without_key(self):
+    def test_api_unavailable_without_key(self, monkeypatch):
         """API is unavailable when ANTHROPIC_API_KEY is not set."""
         extractor = ClaudeExtractor()
-        extractor._api_available = None  # Reset cache
 
-        with patch.dict('os.environ', {}, clear=True):
-            # Clear the key if it exists
-            import os
-            if 'ANTHROPIC_API_KEY' in os.environ:
-                del os.environ['ANTHROPIC_API_KEY']
-            extractor._api_available = None
-            assert extractor.api_available is False
+        monkeypatch.delenv('ANTHROPIC_API_KEY', raising=False)
+        assert extractor.api_available is False
 
 
 class TestResponseParsing:
@@ -250,14 +359,7 @@ class TestResponseParsing:
         """Parses valid JSON response."""
         extractor = ClaudeExtractor()
 
-        response = '''
-        {
-            "memories": [
-                {"category": "patterns", "content": "Use async for I/O.", "relevance": 0.9, "tags": ["async"]}
-            ]
-        }
-        '''
-        memories = extractor._parse_response(response)
+        memories = extractor._parse_response(_RESP_VALID_JSON)
 
         assert len(memories) == 1
         assert memories[0].category == "patterns"
@@ -270,14 +372,7 @@ class TestResponseParsing:
         extractor = ClaudeExtractor()
 
         # No leading whitespace - code block must start at beginning
-        response = '''```json
-{
-    "memories": [
-        {"category": "insights", "content": "This is a valid test insight memory.", "relevance": 0.8, "tags": []}
-    ]
-}
-```'''
-        memories = extractor._parse_response(response)
+        memories = extractor._parse_response(_RESP_MARKDOWN)
 
         assert len(memories) == 1
         assert memories[0].category == "insights"
@@ -286,14 +381,7 @@ class TestResponseParsing:
         """Handles 'memory_entries' as alternative to 'memories'."""
         extractor = ClaudeExtractor()
 
-        response = '''
-        {
-            "memory_entries": [
-                {"category": "learnings", "content": "This is a valid test learning memory.", "relevance": 0.75, "tags": []}
-            ]
-        }
-        '''
-        memories = extractor._parse_response(response)
+        memories = extractor._parse_response(_RESP_MEMORY_ENTRIES)
 
         assert len(memories) == 1
         assert memories[0].category == "learnings"
@@ -302,15 +390,7 @@ class TestResponseParsing:
         """Filters out memories with content < 15 chars."""
         extractor = ClaudeExtractor()
 
-        response = '''
-        {
-            "memories": [
-                {"category": "patterns", "content": "Short.", "relevance": 0.9, "tags": []},
-                {"category": "patterns", "content": "This is a longer valid memory.", "relevance": 0.9, "tags": []}
-            ]
-        }
-        '''
-        memories = extractor._parse_response(response)
+        memories = extractor._parse_response(_RESP_SHORT_CONTENT)
 
         assert len(memories) == 1
         assert "longer valid" in memories[0].content
@@ -319,14 +399,7 @@ class TestResponseParsing:
         """Invalid categories are normalized to 'insights'."""
         extractor = ClaudeExtractor()
 
-        response = '''
-        {
-            "memories": [
-                {"category": "unknown_category", "content": "Test with invalid category here.", "relevance": 0.8, "tags": []}
-            ]
-        }
-        '''
-        memories = extractor._parse_response(response)
+        memories = extractor._parse_response(_RESP_INVALID_CATEGORY)
 
         assert len(memories) == 1
         assert memories[0].category == "insights"
@@ -371,6 +444,7 @@ class TestClaudeCallMethods:
         """Should call Claude via CLI when available."""
         extractor = ClaudeExtractor(use_cli=True)
         extractor._cli_available = True
+        extractor._cache = None  # Disable response cache
 
         with patch('subprocess.run') as mock_run:
             mock_result = MagicMock()
@@ -388,6 +462,7 @@ class TestClaudeCallMethods:
         """Should handle CLI timeout gracefully."""
         extractor = ClaudeExtractor(use_cli=True)
         extractor._cli_available = True
+        extractor._cache = None  # Disable response cache
 
         import subprocess
         with patch('subprocess.run', side_effect=subprocess.TimeoutExpired("claude", 60)):
@@ -399,6 +474,7 @@ class TestClaudeCallMethods:
         """Should handle CLI errors gracefully."""
         extractor = ClaudeExtractor(use_cli=True)
         extractor._cli_available = True
+        extractor._cache = None  # Disable response cache
 
         with patch('subprocess.run') as mock_run:
             mock_result = MagicMock()
@@ -3,15 +3,12 @@ Tests for MemoryLane CLI.
 """
 
 import json
-import sys
 from io import StringIO
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from cli import MemoryLaneCLI
 
 
@@ -108,7 +105,7 @@ class TestRecallCommand:
             mock_config.return_value.get_path.return_value = tmp_path / "memories.json"
 
             with patch('cli.MemoryStore') as mock_store:
-                mock_store.return_value.get_memories.return_value = [
+                sample_memories = [
                     {
                         'id': 'patt-001',
                         'category': 'patterns',
@@ -126,6 +123,11 @@ class TestRecallCommand:
                         'usage_count': 1
                     }
                 ]
+                mock_store.return_value.get_memories.return_value = sample_memories
+                mock_store.return_value.search.side_effect = lambda q, limit=None: [
+                    m for m in sample_memories
+                    if q.lower() in m['content'].lower()
+                ]
 
                 with patch('cli.ProjectRegistry'):
                     with patch('cli.ensure_registered'):
@@ -151,6 +153,7 @@ class TestRecallCommand:
 
             with patch('cli.MemoryStore') as mock_store:
                 mock_store.return_value.get_memories.return_value = []
+                mock_store.return_value.search.return_value = []
 
                 with patch('cli.ProjectRegistry'):
                     with patch('cli.ensure_registered'):
@@ -171,18 +174,13 @@ class TestConfigCommand:
     """Test the config command."""
 
     @pytest.fixture
-    def cli_instance(self, tmp_path):
+    def cli_instance(self, make_cli):
         """Create CLI instance for testing."""
-        with patch('cli.ConfigManager') as mock_config:
-            mock_config.return_value.get_path.return_value = tmp_path / "memories.json"
+        def configure(mock_config, mock_store):
             mock_config.return_value.get.return_value = "test_value"
             mock_config.return_value.config = {"memory": {"max_tokens": 2000}}
 
-            with patch('cli.MemoryStore'):
-                with patch('cli.ProjectRegistry'):
-                    with patch('cli.ensure_registered'):
-                        cli = MemoryLaneCLI(auto_register=False)
-                        yield cli
+        return make_cli(configure)
 
     def test_config_get(self, cli_instance, capsys):
         """Config get should display config value."""
@@ -222,18 +220,12 @@ class TestBackupRestore:
     """Test backup and restore commands."""
 
     @pytest.fixture
-    def cli_instance(self, tmp_path):
+    def cli_instance(self, make_cli, tmp_path):
         """Create CLI instance for testing."""
-        with patch('cli.ConfigManager') as mock_config:
-            mock_config.return_value.get_path.return_value = tmp_path / "memories.json"
-
-            with patch('cli.MemoryStore') as mock_store:
-                mock_store.return_value.export_backup.return_value = tmp_path / "backup.json"
+        def configure(mock_config, mock_store):
+            mock_store.return_value.export_backup.return_value = tmp_path / "backup.json"
 
-                with patch('cli.ProjectRegistry'):
-                    with patch('cli.ensure_registered'):
-                        cli = MemoryLaneCLI(auto_register=False)
-                        yield cli, tmp_path
+        return make_cli(configure), tmp_path
 
     def test_backup_creates_file(self, cli_instance, capsys):
         """Backup command should create backup file."""
@@ -307,8 +299,8 @@ class TestLearnCommand:
         args.text = None
         args.transcript = None
 
-        # Mock stdin to have no data
-        with patch('select.select', return_value=([], [], [])):
+        # Mock stdin as an interactive terminal (nothing piped)
+        with patch('sys.stdin.isatty', return_value=True):
             cli_instance.cmd_learn(args)
 
         captured = capsys.readouterr()
@@ -319,24 +311,18 @@ class TestMemoryCommand:
     """Test individual memory operations."""
 
     @pytest.fixture
-    def cli_instance(self, tmp_path):
+    def cli_instance(self, make_cli):
         """Create CLI instance for testing."""
-        with patch('cli.ConfigManager') as mock_config:
-            mock_config.return_value.get_path.return_value = tmp_path / "memories.json"
-
-            with patch('cli.MemoryStore') as mock_store:
-                mock_store.return_value.get_memory_by_id.return_value = {
-                    'id': 'patt-001',
-                    'category': 'patterns',
-                    'content': 'Test content'
-                }
-                mock_store.return_value.delete_memory.return_value = True
-                mock_store.return_value.update_memory.return_value = True
+        def configure(mock_config, mock_store):
+            mock_store.return_value.get_memory_by_id.return_value = {
+                'id': 'patt-001',
+                'category': 'patterns',
+                'content': 'Test content'
+            }
+            mock_store.return_value.delete_memory.return_value = True
+            mock_store.return_value.update_memory.return_value = True
 
-                with patch('cli.ProjectRegistry'):
-                    with patch('cli.ensure_registered'):
-                        cli = MemoryLaneCLI(auto_register=False)
-                        yield cli
+        return make_cli(configure)
 
     def test_memory_get(self, cli_instance, capsys):
         """Memory get should display memory details."""
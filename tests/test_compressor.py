@@ -2,33 +2,40 @@
 Tests for Context Compression Engine.
 """
 
-import sys
-from pathlib import Path
+import functools
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from compressor import ContextCompressor, CompressedContext
 
 
+@pytest.fixture(scope="module")
+def compressor():
+    """Shared compressor with default settings for tests that don't tune it."""
+    return ContextCompressor()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_compressor(target_tokens):
+    """Shared compressors for tests that tune target_tokens."""
+    return ContextCompressor(target_tokens=target_tokens)
+
+
 class TestTokenEstimation:
     """Test token estimation."""
 
-    def test_estimate_tokens_empty_string(self):
+    def test_estimate_tokens_empty_string(self, compressor):
         """Empty string should have 0 tokens."""
-        compressor = ContextCompressor()
         assert compressor.estimate_tokens("") == 0
 
-    def test_estimate_tokens_single_word(self):
+    def test_estimate_tokens_single_word(self, compressor):
         """Single word should estimate correctly."""
-        compressor = ContextCompressor()
         # 1 word * 1.3 = 1.3 -> 1
         assert compressor.estimate_tokens("hello") == 1
 
-    def test_estimate_tokens_sentence(self):
+    def test_estimate_tokens_sentence(self, compressor):
         """Sentence should estimate based on word count."""
-        compressor = ContextCompressor()
         text = "This is a test sentence with seven words"
         # 8 words * 1.3 = 10.4 -> 10
         tokens = compressor.estimate_tokens(text)
@@ -38,7 +45,7 @@ class TestTokenEstimation:
 class TestCompression:
     """Test compression functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_context(self):
         """Sample context for testing."""
         return """# Project Overview
@@ -62,7 +69,7 @@ We use pytest for testing.
 
     def test_compression_under_target_returns_original(self):
         """Text under target tokens should not be compressed."""
-        compressor = ContextCompressor(target_tokens=1000)
+        compressor = _get_compressor(1000)
         text = "Short text"
 
         result = compressor.compress(text)
@@ -72,7 +79,7 @@ We use pytest for testing.
 
     def test_compression_over_target_reduces_tokens(self, sample_context):
         """Text over target should be compressed."""
-        compressor = ContextCompressor(target_tokens=20)
+        compressor = _get_compressor(20)
 
         result = compressor.compress(sample_context)
 
@@ -81,7 +88,7 @@ We use pytest for testing.
 
     def test_compression_returns_compressed_context_object(self, sample_context):
         """Compression should return CompressedContext dataclass."""
-        compressor = ContextCompressor(target_tokens=50)
+        compressor = _get_compressor(50)
 
         result = compressor.compress(sample_context)
 
@@ -93,7 +100,7 @@ We use pytest for testing.
 
     def test_compression_tracks_sections(self, sample_context):
         """Compression should track kept and removed sections."""
-        compressor = ContextCompressor(target_tokens=30)
+        compressor = _get_compressor(30)
 
         result = compressor.compress(sample_context)
 
@@ -105,15 +112,13 @@ We use pytest for testing.
 class TestSectionParsing:
     """Test markdown section parsing."""
 
-    def test_parse_sections_empty_input(self):
+    def test_parse_sections_empty_input(self, compressor):
         """Empty input should return no sections."""
-        compressor = ContextCompressor()
         sections = compressor._parse_sections("")
         assert sections == []
 
-    def test_parse_sections_single_header(self):
+    def test_parse_sections_single_header(self, compressor):
         """Single header should create one section."""
-        compressor = ContextCompressor()
         text = "# Header\n\nSome content"
 
         sections = compressor._parse_sections(text)
@@ -122,9 +127,8 @@ class TestSectionParsing:
         assert sections[0]['title'] == 'Header'
         assert sections[0]['level'] == 1
 
-    def test_parse_sections_multiple_levels(self):
+    def test_parse_sections_multiple_levels(self, compressor):
         """Should parse multiple heading levels."""
-        compressor = ContextCompressor()
         text = """# Level 1
 
 Content 1
@@ -145,9 +149,8 @@ Content 3
         assert sections[1]['level'] == 2
         assert sections[2]['level'] == 3
 
-    def test_parse_sections_calculates_tokens(self):
+    def test_parse_sections_calculates_tokens(self, compressor):
         """Each section should have token count."""
-        compressor = ContextCompressor()
         text = "# Header\n\nThis is content with several words"
 
         sections = compressor._parse_sections(text)
@@ -158,9 +161,8 @@ Content 3
 class TestDeduplication:
     """Test section deduplication."""
 
-    def test_deduplicate_removes_exact_duplicates(self):
+    def test_deduplicate_removes_exact_duplicates(self, compressor):
         """Exact duplicate sections should be removed."""
-        compressor = ContextCompressor()
         sections = [
             {'title': 'Section 1', 'content': ['Same content'], 'level': 1, 'tokens': 2},
             {'title': 'Section 2', 'content': ['Same content'], 'level': 1, 'tokens': 2}
@@ -170,9 +172,23 @@ class TestDeduplication:
 
         assert len(deduplicated) == 1
 
-    def test_deduplicate_keeps_unique_sections(self):
+    def test_deduplicate_removes_near_duplicates(self, compressor):
+        """Paraphrased duplicate sections should be removed when datasketch is installed."""
+        pytest.importorskip("datasketch")
+        base = ['The project uses JWT tokens for authentication and sessions'] * 10
+        near_dup = list(base)
+        near_dup[0] = 'The project uses JWT tokens for authentication plus sessions'
+        sections = [
+            {'title': 'Auth', 'content': base, 'level': 1, 'tokens': 90},
+            {'title': 'Auth Again', 'content': near_dup, 'level': 1, 'tokens': 90}
+        ]
+
+        deduplicated = compressor._deduplicate_sections(sections)
+
+        assert len(deduplicated) == 1
+
+    def test_deduplicate_keeps_unique_sections(self, compressor):
         """Unique sections should be preserved."""
-        compressor = ContextCompressor()
         sections = [
             {'title': 'Section 1', 'content': ['Unique content A'], 'level': 1, 'tokens': 3},
             {'title': 'Section 2', 'content': ['Different content B'], 'level': 1, 'tokens': 3}
@@ -186,9 +202,8 @@ class TestDeduplication:
 class TestRanking:
     """Test section ranking by importance."""
 
-    def test_rank_sections_important_keywords_boost(self):
+    def test_rank_sections_important_keywords_boost(self, compressor):
         """Sections with important keywords should rank higher."""
-        compressor = ContextCompressor()
         sections = [
             {'title': 'Random', 'content': ['Some text'], 'level': 1, 'tokens': 10},
             {'title': 'Authentication', 'content': ['Auth text'], 'level': 1, 'tokens': 10},
@@ -203,9 +218,8 @@ class TestRanking:
         random_idx = titles.index('Random')
         assert auth_idx < random_idx
 
-    def test_rank_sections_preserves_specified(self):
+    def test_rank_sections_preserves_specified(self, compressor):
         """Sections in preserve list should rank highest."""
-        compressor = ContextCompressor()
         sections = [
             {'title': 'Low Priority', 'content': ['text'], 'level': 1, 'tokens': 10},
             {'title': 'Preserve Me', 'content': ['text'], 'level': 1, 'tokens': 10}
@@ -219,9 +233,8 @@ class TestRanking:
 class TestSectionSelection:
     """Test section selection within token budget."""
 
-    def test_select_sections_respects_budget(self):
+    def test_select_sections_respects_budget(self, compressor):
         """Should not exceed token budget."""
-        compressor = ContextCompressor()
         sections = [
             {'title': 'A', 'content': ['text'], 'level': 1, 'tokens': 50, 'importance_score': 1.0},
             {'title': 'B', 'content': ['text'], 'level': 1, 'tokens': 50, 'importance_score': 0.9},
@@ -233,9 +246,8 @@ class TestSectionSelection:
         total_tokens = sum(s['tokens'] for s in kept)
         assert total_tokens <= 100
 
-    def test_select_sections_prioritizes_high_importance(self):
+    def test_select_sections_prioritizes_high_importance(self, compressor):
         """Higher importance sections should be kept."""
-        compressor = ContextCompressor()
         sections = [
             {'title': 'High', 'content': ['text'], 'level': 1, 'tokens': 40, 'importance_score': 1.0},
             {'title': 'Low', 'content': ['text'], 'level': 1, 'tokens': 40, 'importance_score': 0.3}
@@ -250,9 +262,8 @@ class TestSectionSelection:
 class TestReconstruction:
     """Test text reconstruction from sections."""
 
-    def test_reconstruct_includes_headers(self):
+    def test_reconstruct_includes_headers(self, compressor):
         """Reconstructed text should include headers."""
-        compressor = ContextCompressor()
         sections = [
             {'title': 'Test Section', 'content': ['Line 1', 'Line 2'], 'level': 2}
         ]
@@ -261,9 +272,8 @@ class TestReconstruction:
 
         assert '## Test Section' in result
 
-    def test_reconstruct_includes_content(self):
+    def test_reconstruct_includes_content(self, compressor):
         """Reconstructed text should include content."""
-        compressor = ContextCompressor()
         sections = [
             {'title': 'Section', 'content': ['Content line'], 'level': 1}
         ]
@@ -276,9 +286,8 @@ class TestReconstruction:
 class TestSummarization:
     """Test section summarization."""
 
-    def test_summarize_truncates_long_sections(self):
+    def test_summarize_truncates_long_sections(self, compressor):
         """Long sections should be truncated."""
-        compressor = ContextCompressor()
         section = {
             'title': 'Long Section',
             'content': [f'Line {i}' for i in range(10)],
@@ -292,9 +301,8 @@ class TestSummarization:
         assert len(summarized['content']) < len(section['content'])
         assert summarized['tokens'] < section['tokens']
 
-    def test_summarize_adds_truncation_indicator(self):
+    def test_summarize_adds_truncation_indicator(self, compressor):
         """Summarized sections should indicate truncation."""
-        compressor = ContextCompressor()
         section = {
             'title': 'Section',
             'content': [f'Line {i}' for i in range(10)],
@@ -315,7 +323,7 @@ class TestEdgeCases:
 
     def test_compress_no_headers(self):
         """Text without headers should still work."""
-        compressor = ContextCompressor(target_tokens=10)
+        compressor = _get_compressor(10)
         text = "Just plain text without any markdown headers."
 
         result = compressor.compress(text)
@@ -325,7 +333,7 @@ class TestEdgeCases:
 
     def test_compress_only_headers(self):
         """Text with only headers (no content) should work."""
-        compressor = ContextCompressor(target_tokens=100)
+        compressor = _get_compressor(100)
         text = "# Header 1\n\n## Header 2\n\n### Header 3"
 
         result = compressor.compress(text)
@@ -334,7 +342,7 @@ class TestEdgeCases:
 
     def test_compress_very_small_target(self):
         """Very small target should still produce output."""
-        compressor = ContextCompressor(target_tokens=1)
+        compressor = _get_compressor(1)
         text = "# Header\n\nSome content here"
 
         result = compressor.compress(text)
@@ -2,44 +2,46 @@
 Tests for LLM-backed conversation learning.
 """
 
-from pathlib import Path
-import sys
+import types
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from conversation_learner import ConversationLearner
 
+# Read-only summary shared by every summarize_text call instead of
+# rebuilding the nested structure per invocation
+_SUMMARY_RESULT = types.MappingProxyType({
+    "summary": "Test summary.",
+    "memory_entries": (
+        {
+            "type": "design_decision",
+            "content": "Chose SQLite over JSON for ACID guarantees",
+            "tags": ("db", "storage"),
+            "confidence": 0.9,
+        },
+        {
+            "type": "problem_solved",
+            "content": "Race condition fixed by adding per-file asyncio.Lock",
+            "tags": ("async", "debugging"),
+            "confidence": 0.8,
+        },
+        {
+            "type": "future_consideration",
+            "content": "Consider sharding for very large datasets",
+            "tags": ("scaling",),
+            "confidence": 0.6,
+        },
+    ),
+    "suggested_deletions": (),
+})
+
 
 class FakeSummarizer:
     """Simple stub for SummarizerService."""
 
     def summarize_text(self, raw_text, project_name=None, context_hints=None):
-        return {
-            "summary": "Test summary.",
-            "memory_entries": [
-                {
-                    "type": "design_decision",
-                    "content": "Chose SQLite over JSON for ACID guarantees",
-                    "tags": ["db", "storage"],
-                    "confidence": 0.9,
-                },
-                {
-                    "type": "problem_solved",
-                    "content": "Race condition fixed by adding per-file asyncio.Lock",
-                    "tags": ["async", "debugging"],
-                    "confidence": 0.8,
-                },
-                {
-                    "type": "future_consideration",
-                    "content": "Consider sharding for very large datasets",
-                    "tags": ["scaling"],
-                    "confidence": 0.6,
-                },
-            ],
-            "suggested_deletions": [],
-        }
+        return _SUMMARY_RESULT
 
 
 def test_llm_extraction_maps_categories_and_filters_low_confidence():
@@ -59,3 +61,35 @@ def test_llm_extraction_maps_categories_and_filters_low_confidence():
         assert isinstance(memory.metadata.get("tags"), list)
         assert memory.content.endswith(".")
         assert 0.5 <= memory.relevance_score <= 1.0
+
+
+def test_llm_extraction_tolerates_malformed_tags():
+    """null or string tags from the model must not crash or explode."""
+
+    class MalformedTagsSummarizer:
+        def summarize_text(self, raw_text, project_name=None, context_hints=None):
+            return {
+                "summary": "Test summary.",
+                "memory_entries": [
+                    {
+                        "type": "design_decision",
+                        "content": "Chose SQLite over JSON for ACID guarantees",
+                        "tags": None,
+                        "confidence": 0.9,
+                    },
+                    {
+                        "type": "problem_solved",
+                        "content": "Race condition fixed by adding a lock",
+                        "tags": "db,storage",
+                        "confidence": 0.8,
+                    },
+                ],
+                "suggested_deletions": [],
+            }
+
+    learner = ConversationLearner(summarizer=MalformedTagsSummarizer())
+    memories = learner.extract_from_text("dummy transcript", source="manual")
+
+    assert len(memories) == 2
+    for memory in memories:
+        assert memory.metadata["tags"] == []
@@ -5,28 +5,40 @@ Critical for validating the 30%+ cost reduction claim
 
 import pytest
 import json
-from pathlib import Path
 from dataclasses import dataclass
 from typing import List, Dict
-import sys
 
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Optional fast JSON (pip install orjson) - falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 from memory_store import MemoryStore
 from config_manager import ConfigManager
 
 
-@dataclass
+# Manual __slots__ keeps these instantiable by the hundred without
+# per-instance dicts while staying Python 3.8 compatible
+# (dataclass(slots=True) needs 3.10+)
+@dataclass(frozen=True)
 class InteractionSimulation:
     """Simulated Claude interaction"""
+    __slots__ = ('baseline_tokens', 'compressed_tokens', 'task_type')
     baseline_tokens: int
     compressed_tokens: int
     task_type: str  # 'code_edit', 'bug_fix', 'feature_add', 'refactor'
 
 
-@dataclass
+@dataclass(frozen=True)
 class CostMetrics:
     """Cost calculation results"""
+    __slots__ = (
+        'baseline_cost', 'memorylane_cost', 'savings_dollars',
+        'savings_percent', 'compression_ratio',
+        'total_baseline_tokens', 'total_compressed_tokens'
+    )
     baseline_cost: float
     memorylane_cost: float
     savings_dollars: float
@@ -43,6 +55,9 @@ class CostCalculator:
         self.config = config
         self.input_cost_per_m = config.get('costs.cost_per_million_input_tokens', 3.0)
         self.output_cost_per_m = config.get('costs.cost_per_million_output_tokens', 15.0)
+        # Per-token rates precomputed once for the per-interaction hot path
+        self._rate_in = self.input_cost_per_m / 1_000_000
+        self._rate_out = self.output_cost_per_m / 1_000_000
 
     def calculate_interaction_cost(
         self,
@@ -54,27 +69,27 @@ class CostCalculator:
         if output_tokens is None:
             output_tokens = int(input_tokens * 0.3)
 
-        input_cost = (input_tokens / 1_000_000) * self.input_cost_per_m
-        output_cost = (output_tokens / 1_000_000) * self.output_cost_per_m
-
-        return input_cost + output_cost
+        return input_tokens * self._rate_in + output_tokens * self._rate_out
 
     def calculate_savings(
         self,
         interactions: List[InteractionSimulation]
     ) -> CostMetrics:
         """Calculate total savings across multiple interactions"""
-        total_baseline = 0
-        total_compressed = 0
-        baseline_cost = 0.0
-        compressed_cost = 0.0
+        # Sum tokens as integers in C-level reductions, then price the
+        # totals with two multiplies instead of per-interaction float math
+        rate_in = self.input_cost_per_m / 1_000_000
+        rate_out = self.output_cost_per_m / 1_000_000
 
-        for interaction in interactions:
-            total_baseline += interaction.baseline_tokens
-            total_compressed += interaction.compressed_tokens
+        total_baseline = sum(i.baseline_tokens for i in interactions)
+        total_compressed = sum(i.compressed_tokens for i in interactions)
 
-            baseline_cost += self.calculate_interaction_cost(interaction.baseline_tokens)
-            compressed_cost += self.calculate_interaction_cost(interaction.compressed_tokens)
+        # Output tokens estimated at 30% of input, truncated per
+        # interaction to match calculate_interaction_cost
+        baseline_cost = (total_baseline * rate_in
+                         + sum(int(i.baseline_tokens * 0.3) for i in interactions) * rate_out)
+        compressed_cost = (total_compressed * rate_in
+                           + sum(int(i.compressed_tokens * 0.3) for i in interactions) * rate_out)
 
         savings = baseline_cost - compressed_cost
         savings_pct = (savings / baseline_cost * 100) if baseline_cost > 0 else 0
@@ -91,6 +106,20 @@ class CostCalculator:
         )
 
 
+@pytest.fixture(scope="session")
+def weekly_interactions():
+    """Five-day interaction mix, built once per test session"""
+    # Daily pattern: 10 small edits, 5 medium tasks, 3 large features,
+    # 2 refactors
+    daily = (
+        [InteractionSimulation(15000, 2500, 'code_edit')] * 10
+        + [InteractionSimulation(25000, 4000, 'bug_fix')] * 5
+        + [InteractionSimulation(35000, 5000, 'feature_add')] * 3
+        + [InteractionSimulation(40000, 6000, 'refactor')] * 2
+    )
+    return daily * 5
+
+
 class TestCostSavings:
     """Test cost savings calculations and validation"""
 
@@ -122,61 +151,23 @@ class TestCostSavings:
         savings_pct = (baseline_cost - compressed_cost) / baseline_cost * 100
         assert savings_pct > 50  # Should save >50% with 7x compression
 
-    def test_realistic_weekly_usage(self, calculator):
+    def test_realistic_weekly_usage(self, calculator, weekly_interactions, record_property):
         """Test realistic weekly developer usage pattern"""
-        # Simulate 20 interactions per day for 5 days
-        # Mix of different task types with varying token usage
-
-        interactions = []
-
-        # Daily pattern: 10 small edits, 5 medium tasks, 5 large refactors
-        for day in range(5):
-            # Small code edits (10 per day)
-            for _ in range(10):
-                interactions.append(InteractionSimulation(
-                    baseline_tokens=15000,  # Without memory
-                    compressed_tokens=2500,  # With memory (6x compression)
-                    task_type='code_edit'
-                ))
-
-            # Medium bug fixes (5 per day)
-            for _ in range(5):
-                interactions.append(InteractionSimulation(
-                    baseline_tokens=25000,
-                    compressed_tokens=4000,  # 6.25x compression
-                    task_type='bug_fix'
-                ))
-
-            # Large feature additions (3 per day)
-            for _ in range(3):
-                interactions.append(InteractionSimulation(
-                    baseline_tokens=35000,
-                    compressed_tokens=5000,  # 7x compression
-                    task_type='feature_add'
-                ))
-
-            # Refactoring sessions (2 per day)
-            for _ in range(2):
-                interactions.append(InteractionSimulation(
-                    baseline_tokens=40000,
-                    compressed_tokens=6000,  # 6.67x compression
-                    task_type='refactor'
-                ))
+        # 20 interactions per day for 5 days, mixed task types
+        interactions = weekly_interactions
 
         metrics = calculator.calculate_savings(interactions)
 
-        print("\n" + "=" * 60)
-        print("REALISTIC WEEKLY USAGE SIMULATION")
-        print("=" * 60)
-        print(f"Total Interactions: {len(interactions)}")
-        print(f"Baseline Tokens: {metrics.total_baseline_tokens:,}")
-        print(f"Compressed Tokens: {metrics.total_compressed_tokens:,}")
-        print(f"Compression Ratio: {metrics.compression_ratio:.1f}x")
-        print(f"\nBaseline Cost: ${metrics.baseline_cost:.2f}")
-        print(f"MemoryLane Cost: ${metrics.memorylane_cost:.2f}")
-        print(f"Weekly Savings: ${metrics.savings_dollars:.2f}")
-        print(f"Savings Percent: {metrics.savings_percent:.1f}%")
-        print("=" * 60)
+        # Recorded as test properties instead of printed (visible in
+        # junit XML and with --log-cli-level)
+        record_property("total_interactions", len(interactions))
+        record_property("baseline_tokens", metrics.total_baseline_tokens)
+        record_property("compressed_tokens", metrics.total_compressed_tokens)
+        record_property("compression_ratio", round(metrics.compression_ratio, 1))
+        record_property("baseline_cost", round(metrics.baseline_cost, 2))
+        record_property("memorylane_cost", round(metrics.memorylane_cost, 2))
+        record_property("weekly_savings", round(metrics.savings_dollars, 2))
+        record_property("savings_percent", round(metrics.savings_percent, 1))
 
         # Validate 30%+ savings claim
         assert metrics.savings_percent >= 30, \
@@ -186,7 +177,7 @@ class TestCostSavings:
         assert metrics.compression_ratio >= 5.0, \
             f"Expected >=5x compression, got {metrics.compression_ratio:.1f}x"
 
-    def test_monthly_projection(self, calculator):
+    def test_monthly_projection(self, calculator, record_property):
         """Test monthly cost savings projection"""
         # Typical developer: 100 interactions/week
         weekly_interactions = []
@@ -202,51 +193,40 @@ class TestCostSavings:
         weekly_metrics = calculator.calculate_savings(weekly_interactions)
         monthly_savings = weekly_metrics.savings_dollars * 4
 
-        print("\n" + "=" * 60)
-        print("MONTHLY PROJECTION")
-        print("=" * 60)
-        print(f"Weekly Savings: ${weekly_metrics.savings_dollars:.2f}")
-        print(f"Monthly Savings (4 weeks): ${monthly_savings:.2f}")
-        print(f"Savings Percent: {weekly_metrics.savings_percent:.1f}%")
-        print("=" * 60)
+        record_property("weekly_savings", round(weekly_metrics.savings_dollars, 2))
+        record_property("monthly_savings", round(monthly_savings, 2))
+        record_property("savings_percent", round(weekly_metrics.savings_percent, 1))
 
         # For a developer at $100-500/month API costs,
         # 30% savings = $30-150/month
         assert monthly_savings >= 30, \
             f"Expected >= $30/month savings, got ${monthly_savings:.2f}"
 
-    def test_compression_ratio_targets(self, calculator):
+    @pytest.mark.parametrize("name,ratio", [
+        ('Conservative', 3.0),
+        ('Target', 5.0),
+        ('Optimistic', 7.0),
+        ('Stretch', 10.0),
+    ])
+    def test_compression_ratio_targets(self, calculator, name, ratio, record_property):
         """Test different compression ratio scenarios"""
         baseline = 20000
+        compressed = int(baseline // ratio)
 
-        scenarios = [
-            ('Conservative (3x)', 3.0, baseline // 3),
-            ('Target (5x)', 5.0, baseline // 5),
-            ('Optimistic (7x)', 7.0, baseline // 7),
-            ('Stretch (10x)', 10.0, baseline // 10),
-        ]
-
-        print("\n" + "=" * 60)
-        print("COMPRESSION RATIO SCENARIOS (20K baseline)")
-        print("=" * 60)
+        interactions = [InteractionSimulation(
+            baseline_tokens=baseline,
+            compressed_tokens=compressed,
+            task_type='test'
+        )] * 100
 
-        for name, ratio, compressed in scenarios:
-            interactions = [InteractionSimulation(
-                baseline_tokens=baseline,
-                compressed_tokens=compressed,
-                task_type='test'
-            )] * 100
-
-            metrics = calculator.calculate_savings(interactions)
+        metrics = calculator.calculate_savings(interactions)
 
-            print(f"\n{name}:")
-            print(f"  Compression: {metrics.compression_ratio:.1f}x")
-            print(f"  Tokens: {baseline:,} → {compressed:,}")
-            print(f"  Savings: {metrics.savings_percent:.1f}%")
-            print(f"  Cost/100 interactions: ${metrics.baseline_cost:.2f} → ${metrics.memorylane_cost:.2f}")
-            print(f"  Saved: ${metrics.savings_dollars:.2f}")
+        record_property("scenario", name)
+        record_property("compression_ratio", round(metrics.compression_ratio, 1))
+        record_property("savings_percent", round(metrics.savings_percent, 1))
+        record_property("savings_dollars", round(metrics.savings_dollars, 2))
 
-        print("=" * 60)
+        assert abs(metrics.compression_ratio - baseline / compressed) < 0.001
 
     def test_minimum_viable_savings(self, calculator):
         """Test minimum viable savings threshold"""
@@ -295,14 +275,20 @@ class TestCostSavings:
             "interactions": len(interactions)
         }
 
-        with open(metrics_file, 'w') as f:
-            json.dump(metrics_data, f, indent=2)
+        if orjson is not None:
+            metrics_file.write_bytes(orjson.dumps(metrics_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(metrics_file, 'w') as f:
+                json.dump(metrics_data, f, indent=2)
 
         # Verify metrics file is valid
         assert metrics_file.exists()
 
-        with open(metrics_file, 'r') as f:
-            loaded = json.load(f)
+        if orjson is not None:
+            loaded = orjson.loads(metrics_file.read_bytes())
+        else:
+            with open(metrics_file, 'r') as f:
+                loaded = json.load(f)
 
         assert loaded['cost_savings']['total'] == metrics.savings_dollars
         assert loaded['compression']['avg_ratio'] >= 5.0
@@ -1,27 +1,31 @@
 """Tests for memory curation feature"""
 
-import pytest
-import json
-import tempfile
-from pathlib import Path
-from datetime import datetime
+import itertools
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+import pytest
 
-from memory_store import MemoryStore
 from curation_manager import CurationManager
 
 
+@pytest.fixture(scope="module")
+def curator_factory(tmp_path_factory):
+    """Hand out fresh curation state files under one shared temp directory"""
+    base = tmp_path_factory.mktemp("curation")
+    counter = itertools.count()
+
+    def make():
+        return CurationManager(str(base / f"state{next(counter)}.json"))
+
+    return make
+
+
 class TestCurationManager:
     """Tests for CurationManager"""
 
     @pytest.fixture
-    def temp_curator(self):
+    def temp_curator(self, curator_factory):
         """Create a temporary curation manager"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state_path = Path(tmpdir) / "curation_state.json"
-            yield CurationManager(str(state_path))
+        return curator_factory()
 
     def test_default_state(self, temp_curator):
         """Test default state initialization"""
@@ -98,11 +102,9 @@ class TestMemoryStoreExtensions:
     """Tests for new MemoryStore methods"""
 
     @pytest.fixture
-    def temp_store(self):
+    def temp_store(self, store_factory):
         """Create a temporary memory store"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            store_path = Path(tmpdir) / "test_memories.json"
-            yield MemoryStore(str(store_path))
+        return store_factory()
 
     def test_get_memory_by_id(self, temp_store):
         """Test getting a memory by ID"""
@@ -177,21 +179,29 @@ class TestMemoryStoreExtensions:
 
     def test_get_uncurated_memories_limit(self, temp_store):
         """Test limit on uncurated memories"""
-        # Add many memories
-        for i in range(10):
-            temp_store.add_memory('patterns', f'Memory {i}', 'manual')
+        # Add many memories in one write
+        temp_store.add_memories_bulk([
+            {'category': 'patterns', 'content': f'Memory {i}', 'source': 'manual'}
+            for i in range(10)
+        ])
 
         uncurated = temp_store.get_uncurated_memories(set(), limit=5)
         assert len(uncurated) == 5
 
-    def test_get_uncurated_memories_sorted_by_timestamp(self, temp_store):
+    def test_get_uncurated_memories_sorted_by_timestamp(self, temp_store, monkeypatch):
         """Test that uncurated memories are sorted oldest first"""
-        import time
+        # Inject increasing timestamps instead of sleeping between adds
+        from datetime import datetime
+        from unittest.mock import MagicMock
+
+        fake_datetime = MagicMock(wraps=datetime)
+        fake_datetime.now.side_effect = [
+            datetime(2024, 1, 1, 0, tick // 60, tick % 60) for tick in range(120)
+        ]
+        monkeypatch.setattr('memory_store.datetime', fake_datetime)
 
         id1 = temp_store.add_memory('patterns', 'First', 'manual')
-        time.sleep(0.01)  # Small delay to ensure different timestamps
         id2 = temp_store.add_memory('patterns', 'Second', 'manual')
-        time.sleep(0.01)
         id3 = temp_store.add_memory('patterns', 'Third', 'manual')
 
         uncurated = temp_store.get_uncurated_memories(set(), limit=10)
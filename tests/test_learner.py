@@ -2,21 +2,54 @@
 Tests for Passive Learning Layer.
 """
 
-import sys
+import logging
+import os
 from pathlib import Path
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from config_manager import ConfigManager
+from memory_store import MemoryStore
 from learner import (
     GitParser, FileWatcher, PassiveLearner,
     FileChange, GitCommit
 )
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """Shared default GitParser for tests not bound to a repo path"""
+    return GitParser()
+
+
+@pytest.fixture(scope="module")
+def _mock_templates():
+    """Spec'd config/store mocks allocated once per module"""
+    return (MagicMock(spec=ConfigManager), MagicMock(spec=MemoryStore))
+
+
+@pytest.fixture
+def mock_config(_mock_templates):
+    """Shared config mock, reset to defaults for each test"""
+    config, _ = _mock_templates
+    config.reset_mock(return_value=True, side_effect=True)
+    config.get.return_value = True
+    config.is_file_excluded.return_value = False
+    return config
+
+
+@pytest.fixture
+def mock_store(_mock_templates):
+    """Shared store mock, reset to defaults for each test"""
+    _, store = _mock_templates
+    store.reset_mock(return_value=True, side_effect=True)
+    store.add_memory.return_value = "test-id"
+    return store
+
+
 class TestGitParser:
     """Test Git history parsing."""
 
@@ -51,17 +84,15 @@ class TestGitParser:
 
         assert commits == []
 
-    def test_parse_git_log_empty(self):
+    def test_parse_git_log_empty(self, parser):
         """Should handle empty log output."""
-        parser = GitParser()
 
         commits = parser._parse_git_log("")
 
         assert commits == []
 
-    def test_parse_git_log_single_commit(self):
+    def test_parse_git_log_single_commit(self, parser):
         """Should parse single commit."""
-        parser = GitParser()
         log_output = "abc123|John Doe|1609459200|Initial commit\n1\t0\tfile.py"
 
         commits = parser._parse_git_log(log_output)
@@ -74,9 +105,8 @@ class TestGitParser:
         assert commits[0].deletions == 0
         assert "file.py" in commits[0].files_changed
 
-    def test_parse_git_log_multiple_commits(self):
+    def test_parse_git_log_multiple_commits(self, parser):
         """Should parse multiple commits."""
-        parser = GitParser()
         log_output = """abc123|John|1609459200|First commit
 1\t0\tfile1.py
 
@@ -91,17 +121,15 @@ def456|Jane|1609545600|Second commit
 class TestExtractPatterns:
     """Test pattern extraction from commits."""
 
-    def test_extract_patterns_empty_commits(self):
+    def test_extract_patterns_empty_commits(self, parser):
         """Should return empty list for no commits."""
-        parser = GitParser()
 
         patterns = parser.extract_patterns([])
 
         assert patterns == []
 
-    def test_extract_patterns_detects_frameworks(self):
+    def test_extract_patterns_detects_frameworks(self, parser):
         """Should detect framework mentions in commits."""
-        parser = GitParser()
         commits = [
             GitCommit(
                 hash="abc",
@@ -118,9 +146,8 @@ class TestExtractPatterns:
 
         assert any("react" in p.lower() for p in patterns)
 
-    def test_extract_patterns_detects_bug_fixes(self):
+    def test_extract_patterns_detects_bug_fixes(self, parser):
         """Should detect bug fixes."""
-        parser = GitParser()
         commits = [
             GitCommit(
                 hash="abc",
@@ -137,9 +164,8 @@ class TestExtractPatterns:
 
         assert any("fix" in p.lower() or "bug" in p.lower() for p in patterns)
 
-    def test_extract_patterns_detects_file_types(self):
+    def test_extract_patterns_detects_file_types(self, parser):
         """Should detect primary file extensions."""
-        parser = GitParser()
         commits = [
             GitCommit(
                 hash="abc",
@@ -161,16 +187,9 @@ class TestFileWatcher:
     """Test file watching functionality."""
 
     @pytest.fixture
-    def watcher(self, tmp_path):
+    def watcher(self, mock_config, tmp_path):
         """Create file watcher for testing."""
-        mock_config = MagicMock()
-        mock_config.is_file_excluded.return_value = False
-
-        with patch('learner.Path') as mock_path:
-            mock_path.cwd.return_value = tmp_path
-            watcher = FileWatcher(mock_config)
-            watcher.workspace_root = tmp_path
-            yield watcher
+        return FileWatcher(mock_config, workspace_root=tmp_path)
 
     def test_scan_workspace_finds_files(self, watcher, tmp_path):
         """Should find code files in workspace."""
@@ -182,13 +201,11 @@ class TestFileWatcher:
 
         assert len(files) == 2
 
-    def test_scan_workspace_respects_exclusions(self, tmp_path):
+    def test_scan_workspace_respects_exclusions(self, mock_config, tmp_path):
         """Should exclude files based on config."""
-        mock_config = MagicMock()
         mock_config.is_file_excluded.side_effect = lambda p: 'excluded' in p
 
-        watcher = FileWatcher(mock_config)
-        watcher.workspace_root = tmp_path
+        watcher = FileWatcher(mock_config, workspace_root=tmp_path)
 
         # Create files
         (tmp_path / "app.py").write_text("code")
@@ -200,73 +217,53 @@ class TestFileWatcher:
         assert "app.py" in file_names
         assert "excluded.py" not in file_names
 
-    def test_get_changed_files_detects_new(self, watcher, tmp_path):
-        """Should detect new files."""
-        # First scan - no files
+    @staticmethod
+    def _modify(path):
+        """Rewrite a file, bumping mtime explicitly instead of sleeping"""
+        path.write_text("modified")
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+
+    @pytest.mark.parametrize("change_type,filename,setup,mutate", [
+        ('created', 'new_file.py',
+         lambda f: None,
+         lambda f: f.write_text("new code")),
+        ('modified', 'test.py',
+         lambda f: f.write_text("original"),
+         _modify.__func__),
+        ('deleted', 'delete_me.py',
+         lambda f: f.write_text("to delete"),
+         lambda f: f.unlink()),
+    ])
+    def test_get_changed_files_detects_changes(
+        self, watcher, tmp_path, change_type, filename, setup, mutate
+    ):
+        """Should detect created, modified and deleted files."""
+        target = tmp_path / filename
+        setup(target)
+
+        # First scan establishes the baseline
         watcher.get_changed_files()
 
-        # Create new file
-        (tmp_path / "new_file.py").write_text("new code")
-
+        mutate(target)
         changes = watcher.get_changed_files()
 
-        created = [c for c in changes if c.change_type == 'created']
-        assert len(created) == 1
-        assert "new_file.py" in created[0].path
-
-    def test_get_changed_files_detects_modified(self, watcher, tmp_path):
-        """Should detect modified files."""
-        # Create file
-        test_file = tmp_path / "test.py"
-        test_file.write_text("original")
-
-        # First scan
-        watcher.get_changed_files()
-
-        # Modify file (need to change mtime)
-        import time
-        time.sleep(0.1)
-        test_file.write_text("modified")
-
-        changes = watcher.get_changed_files()
-
-        modified = [c for c in changes if c.change_type == 'modified']
-        assert len(modified) == 1
-
-    def test_get_changed_files_detects_deleted(self, watcher, tmp_path):
-        """Should detect deleted files."""
-        # Create and scan file
-        test_file = tmp_path / "delete_me.py"
-        test_file.write_text("to delete")
-        watcher.get_changed_files()
-
-        # Delete file
-        test_file.unlink()
-
-        changes = watcher.get_changed_files()
-
-        deleted = [c for c in changes if c.change_type == 'deleted']
-        assert len(deleted) == 1
+        matching = [c for c in changes if c.change_type == change_type]
+        assert len(matching) == 1
+        assert filename in matching[0].path
 
 
 class TestPassiveLearner:
     """Test passive learning orchestration."""
 
     @pytest.fixture
-    def learner(self, tmp_path):
+    def learner(self, mock_config, mock_store, tmp_path):
         """Create passive learner for testing."""
-        mock_config = MagicMock()
-        mock_config.get.return_value = True
-        mock_config.is_file_excluded.return_value = False
-
-        mock_store = MagicMock()
-        mock_store.add_memory.return_value = "test-id"
-
         learner = PassiveLearner(mock_config, mock_store)
         learner.file_watcher.workspace_root = tmp_path
-        yield learner
+        return learner
 
-    def test_initial_learning_from_git(self, learner, capsys):
+    def test_initial_learning_from_git(self, learner, caplog):
         """Initial learning should analyze git history."""
         # Mock git parser to return commits
         learner.git_parser.get_recent_commits = MagicMock(return_value=[
@@ -281,12 +278,12 @@ class TestPassiveLearner:
             )
         ])
 
-        learner.initial_learning()
+        with caplog.at_level(logging.INFO, logger='learner'):
+            learner.initial_learning()
 
-        captured = capsys.readouterr()
-        assert "Initial learning" in captured.out
+        assert "Initial learning" in caplog.text
 
-    def test_initial_learning_indexes_workspace(self, learner, tmp_path, capsys):
+    def test_initial_learning_indexes_workspace(self, learner, tmp_path, caplog):
         """Initial learning should index workspace files."""
         # Create some files
         (tmp_path / "src").mkdir()
@@ -294,10 +291,10 @@ class TestPassiveLearner:
 
         learner.git_parser.get_recent_commits = MagicMock(return_value=[])
 
-        learner.initial_learning()
+        with caplog.at_level(logging.INFO, logger='learner'):
+            learner.initial_learning()
 
-        captured = capsys.readouterr()
-        assert "Initial learning" in captured.out
+        assert "Initial learning" in caplog.text
 
     def test_initial_learning_skips_git_if_disabled(self, learner):
         """Should skip git learning if disabled in config."""
@@ -314,53 +311,32 @@ class TestPassiveLearner:
         learner.git_parser.get_recent_commits.assert_not_called()
 
 
-class TestFileChangeDataclass:
-    """Test FileChange dataclass."""
-
-    def test_file_change_creation(self):
-        """Should create FileChange with all fields."""
-        change = FileChange(
-            path="/path/to/file.py",
-            change_type="modified",
-            timestamp=datetime.now(),
-            content_preview="preview"
-        )
-
-        assert change.path == "/path/to/file.py"
-        assert change.change_type == "modified"
-        assert change.content_preview == "preview"
-
-    def test_file_change_optional_preview(self):
-        """Content preview should be optional."""
-        change = FileChange(
-            path="/path/to/file.py",
-            change_type="created",
-            timestamp=datetime.now()
-        )
-
-        assert change.content_preview is None
-
-
-class TestGitCommitDataclass:
-    """Test GitCommit dataclass."""
-
-    def test_git_commit_creation(self):
-        """Should create GitCommit with all fields."""
-        commit = GitCommit(
-            hash="abc123",
-            author="John Doe",
-            timestamp=datetime.now(),
-            message="Test commit",
-            files_changed=["file1.py", "file2.py"],
-            additions=10,
-            deletions=5
-        )
-
-        assert commit.hash == "abc123"
-        assert commit.author == "John Doe"
-        assert len(commit.files_changed) == 2
-        assert commit.additions == 10
-        assert commit.deletions == 5
+class TestDataclasses:
+    """Test FileChange and GitCommit dataclasses."""
+
+    @pytest.mark.parametrize("cls,kwargs,expected", [
+        (FileChange,
+         {'path': "/path/to/file.py", 'change_type': "modified",
+          'content_preview': "preview"},
+         {'path': "/path/to/file.py", 'change_type': "modified",
+          'content_preview': "preview"}),
+        (FileChange,
+         {'path': "/path/to/file.py", 'change_type': "created"},
+         {'content_preview': None}),
+        (GitCommit,
+         {'hash': "abc123", 'author': "John Doe", 'message': "Test commit",
+          'files_changed': ["file1.py", "file2.py"],
+          'additions': 10, 'deletions': 5},
+         {'hash': "abc123", 'author': "John Doe",
+          'files_changed': ["file1.py", "file2.py"],
+          'additions': 10, 'deletions': 5}),
+    ])
+    def test_dataclass_fields(self, cls, kwargs, expected):
+        """Should construct dataclasses and expose the given fields."""
+        obj = cls(timestamp=datetime.now(), **kwargs)
+
+        for field, value in expected.items():
+            assert getattr(obj, field) == value
 
 
 class TestGitParserTimeout:
@@ -381,9 +357,8 @@ class TestGitParserTimeout:
 class TestPatternDeduplication:
     """Test pattern deduplication in extraction."""
 
-    def test_removes_duplicate_patterns(self):
+    def test_removes_duplicate_patterns(self, parser):
         """Should remove duplicate framework detection patterns."""
-        parser = GitParser()
         commits = [
             GitCommit(
                 hash="abc",
@@ -3,26 +3,31 @@ Tests for MemoryStore
 """
 
 import pytest
-import json
-import tempfile
-from pathlib import Path
-from datetime import datetime
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from memory_store import MemoryStore, Memory
 
 
+@pytest.fixture(scope="module")
+def populated_store(store_factory):
+    """Store with a canonical memory mix, built once per module.
+
+    Read-only: tests that mutate state use temp_store instead.
+    """
+    store = store_factory()
+    store.add_memory('patterns', 'Pattern 1', 'manual', 0.9)
+    store.add_memory('patterns', 'Pattern 2', 'manual', 0.7)
+    store.add_memory('insights', 'Insight 1', 'manual', 0.8)
+    store.add_memory('learnings', 'Learning 1', 'manual', 0.4)
+    return store
+
+
 class TestMemoryStore:
     """Test cases for MemoryStore"""
 
     @pytest.fixture
-    def temp_store(self):
+    def temp_store(self, store_factory):
         """Create a temporary memory store for testing"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            store_path = Path(tmpdir) / "test_memories.json"
-            yield MemoryStore(str(store_path))
+        return store_factory()
 
     def test_create_empty_memory(self, temp_store):
         """Test empty memory creation"""
@@ -46,32 +51,26 @@ class TestMemoryStore:
 
         assert memory_id.startswith('pattern-')
 
-        # Verify it was saved
-        data = temp_store.load()
-        assert data['metadata']['total_memories'] == 1
-        assert len(data['categories']['patterns']) == 1
-        assert data['categories']['patterns'][0]['content'] == 'Use async/await for API calls'
+        # Verify it was saved via the public API
+        memory = temp_store.get_memory_by_id(memory_id)
+        assert memory is not None
+        assert memory['content'] == 'Use async/await for API calls'
+        assert temp_store.get_stats()['total_memories'] == 1
 
-    def test_get_memories_by_category(self, temp_store):
+    def test_get_memories_by_category(self, populated_store):
         """Test retrieving memories by category"""
-        temp_store.add_memory('patterns', 'Pattern 1', 'manual', 1.0)
-        temp_store.add_memory('insights', 'Insight 1', 'manual', 0.8)
-        temp_store.add_memory('patterns', 'Pattern 2', 'manual', 0.9)
-
-        patterns = temp_store.get_memories(category='patterns')
+        patterns = populated_store.get_memories(category='patterns')
         assert len(patterns) == 2
 
-        insights = temp_store.get_memories(category='insights')
+        insights = populated_store.get_memories(category='insights')
         assert len(insights) == 1
 
-    def test_get_memories_filtered_by_relevance(self, temp_store):
+    def test_get_memories_filtered_by_relevance(self, populated_store):
         """Test filtering memories by relevance score"""
-        temp_store.add_memory('patterns', 'High relevance', 'manual', 0.9)
-        temp_store.add_memory('patterns', 'Low relevance', 'manual', 0.3)
+        high_rel = populated_store.get_memories(min_relevance=0.7)
 
-        high_rel = temp_store.get_memories(min_relevance=0.7)
-        assert len(high_rel) == 1
-        assert high_rel[0]['content'] == 'High relevance'
+        assert len(high_rel) == 3
+        assert {m['content'] for m in high_rel} == {'Pattern 1', 'Pattern 2', 'Insight 1'}
 
     def test_update_memory_usage(self, temp_store):
         """Test updating memory usage statistics"""
@@ -81,12 +80,11 @@ class TestMemoryStore:
         temp_store.update_memory_usage(memory_id)
         temp_store.update_memory_usage(memory_id)
 
-        # Verify counts
-        data = temp_store.load()
-        memory = data['categories']['patterns'][0]
+        # Verify counts via the public API
+        memory = temp_store.get_memory_by_id(memory_id)
         assert memory['usage_count'] == 2
         assert memory['last_used'] is not None
-        assert data['metadata']['total_retrievals'] == 2
+        assert temp_store.get_stats()['total_retrievals'] == 2
 
     def test_prune_low_relevance(self, temp_store):
         """Test pruning low-relevance memories"""
@@ -100,12 +98,9 @@ class TestMemoryStore:
         remaining = temp_store.get_memories(category='patterns')
         assert len(remaining) == 2
 
-    def test_to_markdown(self, temp_store):
+    def test_to_markdown(self, populated_store):
         """Test markdown export"""
-        temp_store.add_memory('patterns', 'Pattern 1', 'manual', 1.0)
-        temp_store.add_memory('insights', 'Insight 1', 'manual', 0.8)
-
-        markdown = temp_store.to_markdown()
+        markdown = populated_store.to_markdown()
 
         assert '# MemoryLane Context' in markdown
         assert '## Patterns' in markdown
@@ -113,15 +108,11 @@ class TestMemoryStore:
         assert 'Pattern 1' in markdown
         assert 'Insight 1' in markdown
 
-    def test_get_stats(self, temp_store):
+    def test_get_stats(self, populated_store):
         """Test statistics generation"""
-        temp_store.add_memory('patterns', 'P1', 'manual', 0.9)
-        temp_store.add_memory('patterns', 'P2', 'manual', 0.7)
-        temp_store.add_memory('insights', 'I1', 'manual', 0.8)
+        stats = populated_store.get_stats()
 
-        stats = temp_store.get_stats()
-
-        assert stats['total_memories'] == 3
+        assert stats['total_memories'] == 4
         assert stats['categories']['patterns']['count'] == 2
         assert stats['categories']['insights']['count'] == 1
         assert stats['categories']['patterns']['avg_relevance'] == 0.8
@@ -143,19 +134,51 @@ class TestMemoryStore:
         temp_store.import_backup(backup_path)
 
         # Verify restoration
-        data = temp_store.load()
-        assert data['metadata']['total_memories'] == 2
-        assert len(data['categories']['patterns']) == 1
+        assert temp_store.get_stats()['total_memories'] == 2
+        assert len(temp_store.get_memories(category='patterns')) == 1
 
     def test_invalid_category_raises_error(self, temp_store):
         """Test that invalid category raises ValueError"""
         with pytest.raises(ValueError):
             temp_store.add_memory('invalid_category', 'Test', 'manual')
 
+    def test_search_index_refreshes_after_external_write(self, temp_store):
+        """Reloading an externally changed file must rebuild the search index"""
+        temp_store.add_memory('patterns', 'original entry', 'manual')
+        assert temp_store.search('original')
+
+        writer = MemoryStore(str(temp_store.memory_path))
+        writer.add_memory('patterns', 'external entry', 'manual')
+
+        temp_store.load()  # mtime miss: reparse and drop the stale index
+        results = temp_store.search('external')
+        assert len(results) == 1
+
+    def test_bulk_invalid_category_leaves_store_unchanged(self, temp_store):
+        """A failed bulk add must not leak earlier entries into the store"""
+        with pytest.raises(ValueError):
+            temp_store.add_memories_bulk([
+                {'category': 'patterns', 'content': 'good one', 'source': 'manual'},
+                {'category': 'bogus', 'content': 'bad one', 'source': 'manual'},
+            ])
+
+        with pytest.raises(ValueError):
+            temp_store.add_memories_bulk([
+                {'category': 'patterns', 'content': 'good two', 'source': 'manual'},
+                {'category': 'patterns', 'content': 'no source here'},
+            ])
+
+        # A later unrelated add must not persist the failed batches
+        temp_store.add_memory('insights', 'Unrelated', 'manual')
+        assert temp_store.get_memories(category='patterns') == []
+
     def test_memory_limit_per_category(self, temp_store):
         """Test retrieving limited number of memories"""
-        for i in range(10):
-            temp_store.add_memory('patterns', f'Pattern {i}', 'manual', 1.0 - i * 0.1)
+        temp_store.add_memories_bulk([
+            {'category': 'patterns', 'content': f'Pattern {i}',
+             'source': 'manual', 'relevance_score': 1.0 - i * 0.1}
+            for i in range(10)
+        ])
 
         limited = temp_store.get_memories(category='patterns', limit=5)
         assert len(limited) == 5
@@ -2,18 +2,80 @@
 Tests for Project Registry.
 """
 
+import itertools
 import json
-import sys
+import os
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from uuid import uuid4
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from project_registry import ProjectRegistry, ensure_registered
 
 
+# Constant payloads, serialized once at import instead of per test
+_MEMORIES_EMPTY = b'{"version":"1.0","categories":{}}'
+_MEMORIES_PATTERN = json.dumps({
+    'version': '1.0',
+    'categories': {
+        'patterns': {
+            'memories': [{
+                'id': 'patt-001',
+                'content': 'Test pattern',
+                'relevance_score': 0.8,
+                'source': 'test',
+                'created_at': '2024-01-01',
+                'usage_count': 0
+            }]
+        }
+    }
+}).encode()
+
+
+def _quick_write(path: Path, data: bytes) -> None:
+    """Write a small file with one open/write/close, no text-mode encoding"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="session")
+def fast_tmp_root(tmp_path_factory):
+    """Flat base directory created once, without mktemp numbering"""
+    return tmp_path_factory.mktemp("plr", numbered=False)
+
+
+@pytest.fixture
+def fast_tmp(fast_tmp_root):
+    """Per-test directory derived with one mkdir, skipping the
+    listdir/collision scan pytest's numbered tmp_path performs"""
+    path = fast_tmp_root / uuid4().hex[:8]
+    path.mkdir()
+    return path
+
+
+@pytest.fixture(scope="module")
+def make_project(tmp_path_factory):
+    """Build canonical project trees under one shared temp directory.
+
+    Each call creates <name>/.memorylane/memories.json in a fresh parent,
+    replacing the mkdir/mkdir/write_text boilerplate in individual tests.
+    """
+    base = tmp_path_factory.mktemp("projects")
+    counter = itertools.count()
+
+    def make(name="project", memories=b"{}"):
+        project = base / f"p{next(counter)}" / name
+        (project / ".memorylane").mkdir(parents=True)
+        _quick_write(project / ".memorylane" / "memories.json", memories)
+        return project
+
+    return make
+
+
 class TestProjectRegistryInit:
     """Test registry initialization."""
 
@@ -57,10 +119,10 @@ class TestRegistryLoadSave:
     def test_load_reads_existing_file(self, tmp_path):
         """Should load existing registry file."""
         registry_path = tmp_path / "registry.json"
-        registry_path.write_text(json.dumps({
+        _quick_write(registry_path, json.dumps({
             'version': '1.0',
             'projects': [{'path': '/test', 'name': 'test'}]
-        }))
+        }).encode())
 
         registry = ProjectRegistry(registry_path=registry_path)
         data = registry._load()
@@ -71,7 +133,7 @@ class TestRegistryLoadSave:
     def test_load_handles_invalid_json(self, tmp_path):
         """Should create empty registry if file is invalid JSON."""
         registry_path = tmp_path / "registry.json"
-        registry_path.write_text("invalid json")
+        _quick_write(registry_path, b"invalid json")
 
         registry = ProjectRegistry(registry_path=registry_path)
         data = registry._load()
@@ -113,9 +175,8 @@ class TestRegisterProject:
         result = registry.register(project_path)
 
         assert result is True
-        data = registry._load()
-        assert len(data['projects']) == 1
-        assert data['projects'][0]['name'] == 'my_project'
+        assert len(registry._registry['projects']) == 1
+        assert registry._registry['projects'][0]['name'] == 'my_project'
 
     def test_register_with_custom_name(self, tmp_path):
         """Should use custom name when provided."""
@@ -126,8 +187,7 @@ class TestRegisterProject:
         registry = ProjectRegistry(registry_path=registry_path)
         registry.register(project_path, name="Custom Name")
 
-        data = registry._load()
-        assert data['projects'][0]['name'] == 'Custom Name'
+        assert registry._registry['projects'][0]['name'] == 'Custom Name'
 
     def test_register_updates_existing(self, tmp_path):
         """Should update last_accessed for existing project."""
@@ -140,8 +200,7 @@ class TestRegisterProject:
         result = registry.register(project_path)
 
         assert result is False  # Already existed
-        data = registry._load()
-        assert len(data['projects']) == 1
+        assert len(registry._registry['projects']) == 1
 
 
 class TestUnregisterProject:
@@ -159,8 +218,7 @@ class TestUnregisterProject:
         result = registry.unregister(project_path)
 
         assert result is True
-        data = registry._load()
-        assert len(data['projects']) == 0
+        assert registry._registry['projects'] == []
 
     def test_unregister_nonexistent_project(self, tmp_path):
         """Should return False for nonexistent project."""
@@ -185,16 +243,12 @@ class TestListProjects:
 
         assert projects == []
 
-    def test_list_validates_projects(self, tmp_path):
+    def test_list_validates_projects(self, tmp_path, make_project):
         """Should validate projects exist when validate=True."""
         registry_path = tmp_path / "registry.json"
 
         # Create registry with one valid and one invalid project
-        valid_project = tmp_path / "valid"
-        valid_project.mkdir()
-        (valid_project / ".memorylane").mkdir()
-        (valid_project / ".memorylane" / "memories.json").write_text("{}")
-
+        valid_project = make_project("valid")
         invalid_project = tmp_path / "invalid"
 
         registry = ProjectRegistry(registry_path=registry_path)
@@ -274,41 +328,20 @@ class TestGetProject:
 class TestSearchAll:
     """Test cross-project search."""
 
-    def test_search_empty_registry(self, tmp_path):
+    def test_search_empty_registry(self, fast_tmp):
         """Should return empty list for empty registry."""
-        registry_path = tmp_path / "registry.json"
+        registry_path = fast_tmp / "registry.json"
         registry = ProjectRegistry(registry_path=registry_path)
 
         results = registry.search_all("query")
 
         assert results == []
 
-    def test_search_tags_results_with_project(self, tmp_path):
+    def test_search_tags_results_with_project(self, fast_tmp, make_project):
         """Should tag results with project info."""
-        registry_path = tmp_path / "registry.json"
-
-        # Create a valid project with memories
-        project_path = tmp_path / "project1"
-        project_path.mkdir()
-        mem_dir = project_path / ".memorylane"
-        mem_dir.mkdir()
+        registry_path = fast_tmp / "registry.json"
 
-        memories_data = {
-            'version': '1.0',
-            'categories': {
-                'patterns': {
-                    'memories': [{
-                        'id': 'patt-001',
-                        'content': 'Test pattern',
-                        'relevance_score': 0.8,
-                        'source': 'test',
-                        'created_at': '2024-01-01',
-                        'usage_count': 0
-                    }]
-                }
-            }
-        }
-        (mem_dir / "memories.json").write_text(json.dumps(memories_data))
+        project_path = make_project("project1", memories=_MEMORIES_PATTERN)
 
         registry = ProjectRegistry(registry_path=registry_path)
         registry.register(project_path, name="project1")
@@ -321,20 +354,13 @@ class TestSearchAll:
             assert '_project_name' in results[0]
             assert '_project_path' in results[0]
 
-    def test_search_excludes_current_project(self, tmp_path):
+    def test_search_excludes_current_project(self, fast_tmp, make_project):
         """Should exclude current project when specified."""
-        registry_path = tmp_path / "registry.json"
+        registry_path = fast_tmp / "registry.json"
 
         # Create two projects
-        project1 = tmp_path / "project1"
-        project1.mkdir()
-        (project1 / ".memorylane").mkdir()
-        (project1 / ".memorylane" / "memories.json").write_text('{"version":"1.0","categories":{}}')
-
-        project2 = tmp_path / "project2"
-        project2.mkdir()
-        (project2 / ".memorylane").mkdir()
-        (project2 / ".memorylane" / "memories.json").write_text('{"version":"1.0","categories":{}}')
+        project1 = make_project("project1", memories=_MEMORIES_EMPTY)
+        project2 = make_project("project2", memories=_MEMORIES_EMPTY)
 
         registry = ProjectRegistry(registry_path=registry_path)
         registry.register(project1)
@@ -344,37 +370,31 @@ class TestSearchAll:
         results = registry.search_all("", exclude_current=True, current_path=project1)
 
         # Results should not include project1
+        excluded = str(project1.resolve())
         for result in results:
             if '_project_path' in result:
-                assert result['_project_path'] != str(project1.resolve())
+                assert result['_project_path'] != excluded
 
 
 class TestGetAllMemories:
     """Test getting memories from all projects."""
 
-    def test_get_all_empty_registry(self, tmp_path):
+    def test_get_all_empty_registry(self, fast_tmp):
         """Should return empty dict for empty registry."""
-        registry_path = tmp_path / "registry.json"
+        registry_path = fast_tmp / "registry.json"
         registry = ProjectRegistry(registry_path=registry_path)
 
         result = registry.get_all_memories()
 
         assert result == {}
 
-    def test_get_all_filters_by_project_names(self, tmp_path):
+    def test_get_all_filters_by_project_names(self, fast_tmp, make_project):
         """Should filter by project names when specified."""
-        registry_path = tmp_path / "registry.json"
+        registry_path = fast_tmp / "registry.json"
 
         # Create two projects
-        project1 = tmp_path / "project1"
-        project1.mkdir()
-        (project1 / ".memorylane").mkdir()
-        (project1 / ".memorylane" / "memories.json").write_text('{"version":"1.0","categories":{}}')
-
-        project2 = tmp_path / "project2"
-        project2.mkdir()
-        (project2 / ".memorylane").mkdir()
-        (project2 / ".memorylane" / "memories.json").write_text('{"version":"1.0","categories":{}}')
+        project1 = make_project("project1", memories=_MEMORIES_EMPTY)
+        project2 = make_project("project2", memories=_MEMORIES_EMPTY)
 
         registry = ProjectRegistry(registry_path=registry_path)
         registry.register(project1)
@@ -389,15 +409,12 @@ class TestGetAllMemories:
 class TestCleanupStale:
     """Test stale project cleanup."""
 
-    def test_removes_stale_projects(self, tmp_path):
+    def test_removes_stale_projects(self, fast_tmp, make_project):
         """Should remove projects that no longer exist."""
-        registry_path = tmp_path / "registry.json"
+        registry_path = fast_tmp / "registry.json"
 
         # Create one valid project
-        valid_project = tmp_path / "valid"
-        valid_project.mkdir()
-        (valid_project / ".memorylane").mkdir()
-        (valid_project / ".memorylane" / "memories.json").write_text("{}")
+        valid_project = make_project("valid")
 
         registry = ProjectRegistry(registry_path=registry_path)
         registry._registry = {
@@ -411,18 +428,14 @@ class TestCleanupStale:
         removed = registry.cleanup_stale()
 
         assert removed == 1
-        data = registry._load()
-        assert len(data['projects']) == 1
-        assert data['projects'][0]['name'] == 'valid'
+        assert len(registry._registry['projects']) == 1
+        assert registry._registry['projects'][0]['name'] == 'valid'
 
-    def test_returns_zero_when_nothing_to_cleanup(self, tmp_path):
+    def test_returns_zero_when_nothing_to_cleanup(self, fast_tmp, make_project):
         """Should return 0 when all projects valid."""
-        registry_path = tmp_path / "registry.json"
+        registry_path = fast_tmp / "registry.json"
 
-        valid_project = tmp_path / "valid"
-        valid_project.mkdir()
-        (valid_project / ".memorylane").mkdir()
-        (valid_project / ".memorylane" / "memories.json").write_text("{}")
+        valid_project = make_project("valid")
 
         registry = ProjectRegistry(registry_path=registry_path)
         registry._registry = {
@@ -435,25 +448,38 @@ class TestCleanupStale:
         assert removed == 0
 
 
+class _StubRegistry:
+    """Tiny ProjectRegistry stand-in that records register() calls"""
+
+    last = None
+
+    def __init__(self, *args, **kwargs):
+        _StubRegistry.last = self
+        self.register_calls = []
+
+    def register(self, project_path, **kwargs):
+        self.register_calls.append(project_path)
+        return True
+
+
 class TestEnsureRegistered:
     """Test ensure_registered convenience function."""
 
-    def test_registers_existing_project(self, tmp_path):
-        """Should register project with memories."""
-        project_path = tmp_path / "project"
-        project_path.mkdir()
-        (project_path / ".memorylane").mkdir()
-        (project_path / ".memorylane" / "memories.json").write_text("{}")
+    @pytest.fixture
+    def stub_registry(self, monkeypatch):
+        """Swap in the stub class without MagicMock machinery"""
+        _StubRegistry.last = None
+        monkeypatch.setattr('project_registry.ProjectRegistry', _StubRegistry)
+        return _StubRegistry
 
-        with patch('project_registry.ProjectRegistry') as mock_registry_class:
-            mock_registry = MagicMock()
-            mock_registry.register.return_value = True
-            mock_registry_class.return_value = mock_registry
+    def test_registers_existing_project(self, make_project, stub_registry):
+        """Should register project with memories."""
+        project_path = make_project()
 
-            result = ensure_registered(project_path)
+        result = ensure_registered(project_path)
 
-            assert result is True
-            mock_registry.register.assert_called_once_with(project_path)
+        assert result is True
+        assert stub_registry.last.register_calls == [project_path]
 
     def test_skips_project_without_memories(self, tmp_path):
         """Should not register project without memories file."""
@@ -464,21 +490,16 @@ class TestEnsureRegistered:
 
         assert result is False
 
-    def test_uses_cwd_by_default(self, tmp_path, monkeypatch):
+    def test_uses_cwd_by_default(self, tmp_path, monkeypatch, stub_registry):
         """Should use current directory by default."""
         # Create memories in tmp_path
         (tmp_path / ".memorylane").mkdir()
-        (tmp_path / ".memorylane" / "memories.json").write_text("{}")
+        _quick_write(tmp_path / ".memorylane" / "memories.json", b"{}")
 
         # Change to tmp_path directory
         monkeypatch.chdir(tmp_path)
 
-        with patch('project_registry.ProjectRegistry') as mock_registry_class:
-            mock_registry = MagicMock()
-            mock_registry.register.return_value = True
-            mock_registry_class.return_value = mock_registry
-
-            result = ensure_registered()  # No path provided
+        result = ensure_registered()  # No path provided
 
-            # Should have called register
-            mock_registry.register.assert_called_once()
+        # Should have called register
+        assert len(stub_registry.last.register_calls) == 1
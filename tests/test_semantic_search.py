@@ -3,46 +3,56 @@ Tests for Semantic Search module.
 
 Note: These tests mock the sentence-transformers dependency to run in CI.
 For tests that actually use the model, mark with @pytest.mark.local_only.
+
+The module imports sentence-transformers lazily (inside __init__ and
+is_available), so patching sys.modules is enough — no importlib.reload.
 """
 
-import sys
 import math
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import semantic_search
+
+
+@pytest.fixture(scope="module")
+def semantic_search_module():
+    """The module under test, imported once for the whole file."""
+    return semantic_search
+
+
+def _make_mocked_searcher(configure_model=None):
+    """Build a SemanticSearcher backed by a mocked model."""
+    mock_st = MagicMock()
+    mock_model = MagicMock()
+    if configure_model:
+        configure_model(mock_model)
+    mock_st.SentenceTransformer.return_value = mock_model
+
+    with patch.dict('sys.modules', {'sentence_transformers': mock_st}):
+        return semantic_search.SemanticSearcher()
 
 
 class TestSemanticSearcherInit:
     """Test SemanticSearcher initialization."""
 
-    def test_raises_import_error_without_dependencies(self):
+    def test_raises_import_error_without_dependencies(self, semantic_search_module):
         """Should raise ImportError when sentence-transformers not available."""
         with patch.dict('sys.modules', {'sentence_transformers': None}):
-            # Force reimport
-            import importlib
-            import semantic_search
-            importlib.reload(semantic_search)
-
             with pytest.raises(ImportError) as excinfo:
-                semantic_search.SemanticSearcher()
+                semantic_search_module.SemanticSearcher()
 
             assert "sentence-transformers" in str(excinfo.value)
 
-    def test_initializes_with_mocked_model(self):
+    def test_initializes_with_mocked_model(self, semantic_search_module):
         """Should initialize when dependencies available."""
         mock_st = MagicMock()
         mock_model = MagicMock()
         mock_st.SentenceTransformer.return_value = mock_model
 
         with patch.dict('sys.modules', {'sentence_transformers': mock_st}):
-            import importlib
-            import semantic_search
-            importlib.reload(semantic_search)
-
-            searcher = semantic_search.SemanticSearcher()
+            searcher = semantic_search_module.SemanticSearcher()
 
             assert searcher.available is True
             assert searcher.model == mock_model
@@ -51,20 +61,11 @@ class TestSemanticSearcherInit:
 class TestSimilarityCalculation:
     """Test cosine similarity calculation."""
 
-    @pytest.fixture
-    def searcher(self):
-        """Create searcher with mocked dependencies."""
-        mock_st = MagicMock()
-        mock_model = MagicMock()
-        mock_st.SentenceTransformer.return_value = mock_model
-
-        with patch.dict('sys.modules', {'sentence_transformers': mock_st}):
-            import importlib
-            import semantic_search
-            importlib.reload(semantic_search)
-
-            searcher = semantic_search.SemanticSearcher()
-            yield searcher
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def searcher():
+        """One mocked searcher per class — similarity() is pure."""
+        return _make_mocked_searcher()
 
     def test_identical_vectors_similarity_one(self, searcher):
         """Identical vectors should have similarity 1.0."""
@@ -101,28 +102,49 @@ class TestSimilarityCalculation:
 
         assert result == 0.0
 
+    def test_similarity_batch_matches_pairwise(self, searcher):
+        """Batched similarity should agree with per-pair similarity."""
+        vecs1 = [[1.0, 0.0], [1.0, 1.0], [0.0, 0.0], [0.3, 0.7]]
+        vecs2 = [[0.0, 1.0], [-1.0, -1.0], [1.0, 2.0], [0.5, 0.5]]
+
+        batched = searcher.similarity_batch(vecs1, vecs2)
+
+        expected = [searcher.similarity(a, b) for a, b in zip(vecs1, vecs2)]
+        assert len(batched) == len(expected)
+        for got, want in zip(batched, expected):
+            assert abs(got - want) < 0.0001
+
+    def test_similarity_batch_matches_numpy(self, searcher):
+        """Batched similarity should match the reference numpy formula."""
+        np = pytest.importorskip("numpy")
+
+        rng = np.random.default_rng(0)
+        a = rng.random((1024, 64), dtype=np.float32)
+        b = rng.random((1024, 64), dtype=np.float32)
+        expected = np.sum(a * b, axis=1) / (
+            np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1)
+        )
+
+        batched = searcher.similarity_batch(a.tolist(), b.tolist())
+
+        assert np.allclose(batched, expected, atol=1e-5)
+
 
 class TestEmbedding:
     """Test embedding generation."""
 
-    @pytest.fixture
-    def searcher(self):
-        """Create searcher with mocked model."""
-        mock_st = MagicMock()
-        mock_model = MagicMock()
+    @staticmethod
+    def _configure_model(mock_model):
         # Return a numpy-like array
         mock_array = MagicMock()
         mock_array.tolist.return_value = [0.1, 0.2, 0.3]
         mock_model.encode.return_value = mock_array
-        mock_st.SentenceTransformer.return_value = mock_model
-
-        with patch.dict('sys.modules', {'sentence_transformers': mock_st}):
-            import importlib
-            import semantic_search
-            importlib.reload(semantic_search)
 
-            searcher = semantic_search.SemanticSearcher()
-            yield searcher
+    @pytest.fixture(scope="class")
+    @classmethod
+    def searcher(cls):
+        """One mocked searcher per class."""
+        return _make_mocked_searcher(cls._configure_model)
 
     def test_embed_returns_list(self, searcher):
         """embed should return a list of floats."""
@@ -133,41 +155,40 @@ class TestEmbedding:
 
     def test_embed_calls_model_encode(self, searcher):
         """embed should call model.encode."""
-        searcher.embed("test text")
+        searcher.model.encode.reset_mock()
+
+        searcher.embed("different text")
 
         searcher.model.encode.assert_called()
 
 
+class _Vec(list):
+    """Minimal numpy-array stand-in: a list that answers tolist()"""
+
+    def tolist(self):
+        return list(self)
+
+
+def _fake_encode(text, **kwargs):
+    """Predictable embeddings without MagicMock attribute machinery"""
+    if 'query' in text.lower():
+        return _Vec([1.0, 0.0, 0.0])
+    if 'relevant' in text.lower():
+        return _Vec([0.9, 0.1, 0.0])  # Similar to query
+    return _Vec([0.0, 1.0, 0.0])  # Orthogonal
+
+
 class TestSearch:
     """Test memory search functionality."""
 
     @pytest.fixture
     def searcher(self):
         """Create searcher with predictable embeddings."""
-        mock_st = MagicMock()
-        mock_model = MagicMock()
-
-        # Return different embeddings based on input
-        def mock_encode(text, **kwargs):
-            mock_array = MagicMock()
-            if 'query' in text.lower():
-                mock_array.tolist.return_value = [1.0, 0.0, 0.0]
-            elif 'relevant' in text.lower():
-                mock_array.tolist.return_value = [0.9, 0.1, 0.0]  # Similar to query
-            else:
-                mock_array.tolist.return_value = [0.0, 1.0, 0.0]  # Orthogonal
-            return mock_array
-
-        mock_model.encode = mock_encode
-        mock_st.SentenceTransformer.return_value = mock_model
 
-        with patch.dict('sys.modules', {'sentence_transformers': mock_st}):
-            import importlib
-            import semantic_search
-            importlib.reload(semantic_search)
+        def configure_model(mock_model):
+            mock_model.encode = _fake_encode
 
-            searcher = semantic_search.SemanticSearcher()
-            yield searcher
+        return _make_mocked_searcher(configure_model)
 
     def test_search_empty_memories(self, searcher):
         """Should return empty list for empty memories."""
@@ -224,52 +245,28 @@ class TestSearch:
 class TestIsAvailable:
     """Test availability check."""
 
-    def test_returns_true_when_installed(self):
+    def test_returns_true_when_installed(self, semantic_search_module):
         """Should return True when sentence-transformers installed."""
         mock_st = MagicMock()
 
         with patch.dict('sys.modules', {'sentence_transformers': mock_st}):
-            import importlib
-            import semantic_search
-            importlib.reload(semantic_search)
-
-            result = semantic_search.is_available()
+            result = semantic_search_module.is_available()
 
             assert result is True
 
-    def test_returns_false_when_not_installed(self):
+    def test_returns_false_when_not_installed(self, semantic_search_module):
         """Should return False when sentence-transformers not installed."""
-        # Remove from modules
-        import sys as sys_module
-        original = sys_module.modules.get('sentence_transformers')
-
-        try:
-            if 'sentence_transformers' in sys_module.modules:
-                del sys_module.modules['sentence_transformers']
-
-            import importlib
-            import semantic_search
-            importlib.reload(semantic_search)
-
-            # Mock the import to fail
-            with patch('builtins.__import__', side_effect=ImportError):
-                result = semantic_search.is_available()
+        with patch.dict('sys.modules', {'sentence_transformers': None}):
+            result = semantic_search_module.is_available()
 
-            assert result is False
-        finally:
-            if original:
-                sys_module.modules['sentence_transformers'] = original
+        assert result is False
 
 
 class TestConvenienceFunction:
     """Test semantic_search convenience function."""
 
-    def test_raises_import_error_without_dependencies(self):
+    def test_raises_import_error_without_dependencies(self, semantic_search_module):
         """Should raise ImportError when dependencies not available."""
         with patch.dict('sys.modules', {'sentence_transformers': None}):
-            import importlib
-            import semantic_search
-            importlib.reload(semantic_search)
-
             with pytest.raises(ImportError):
-                semantic_search.semantic_search("query", [])
+                semantic_search_module.semantic_search("query", [])
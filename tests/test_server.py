@@ -3,47 +3,56 @@ Tests for MemoryLane Sidecar Server.
 """
 
 import json
-import os
-import sys
 import socket
-import tempfile
 import threading
-import time
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from server import MemoryLaneServer, MemoryLaneClient
 
 
+@pytest.fixture(scope="module")
+def _mock_config_template():
+    """Config mock allocated once per module; reset and rewired per test"""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_config(_mock_config_template, tmp_path):
+    """Shared config mock pointing get_path at this test's tmp_path"""
+    config = _mock_config_template
+    config.reset_mock(return_value=True, side_effect=True)
+    path_map = {
+        'memories_file': tmp_path / "memories.json",
+        'memory_dir': tmp_path
+    }
+    config.get_path.side_effect = lambda key: path_map.get(key, tmp_path / key)
+    return config
+
+
+@pytest.fixture
+def server(mock_config, tmp_path):
+    """Server with a mocked store and per-test socket path"""
+    with patch('server.MemoryStore'):
+        yield MemoryLaneServer(mock_config, socket_path=str(tmp_path / "test.sock"))
+
+
 class TestServerInitialization:
     """Test server initialization."""
 
-    def test_server_creates_with_config(self, tmp_path):
+    def test_server_creates_with_config(self, mock_config, tmp_path):
         """Server should initialize with config."""
-        mock_config = MagicMock()
-        mock_config.get_path.side_effect = lambda key: {
-            'memories_file': tmp_path / "memories.json",
-            'memory_dir': tmp_path
-        }.get(key, tmp_path / key)
-
         with patch('server.MemoryStore'):
             server = MemoryLaneServer(mock_config, socket_path=str(tmp_path / "test.sock"))
 
             assert server.socket_path == str(tmp_path / "test.sock")
             assert server.running is False
 
-    def test_server_uses_default_socket_path(self, tmp_path):
+    def test_server_uses_default_socket_path(self, mock_config):
         """Server should use default socket path if not specified."""
-        mock_config = MagicMock()
-        mock_config.get_path.side_effect = lambda key: {
-            'memories_file': tmp_path / "memories.json",
-            'memory_dir': tmp_path
-        }.get(key, tmp_path / key)
-
         with patch('server.MemoryStore'):
             server = MemoryLaneServer(mock_config)
 
@@ -54,14 +63,8 @@ class TestRequestProcessing:
     """Test request processing."""
 
     @pytest.fixture
-    def server(self, tmp_path):
-        """Create server instance for testing."""
-        mock_config = MagicMock()
-        mock_config.get_path.side_effect = lambda key: {
-            'memories_file': tmp_path / "memories.json",
-            'memory_dir': tmp_path
-        }.get(key, tmp_path / key)
-
+    def server(self, mock_config, tmp_path):
+        """Create server instance with a store configured for reads."""
         with patch('server.MemoryStore') as mock_store:
             mock_store.return_value.add_memory.return_value = "test-id-001"
             mock_store.return_value.get_memories.return_value = [
@@ -183,45 +186,72 @@ class TestClientMethods:
         assert 'Failed to communicate' in response['error']
 
 
-class TestServerStats:
-    """Test server statistics tracking."""
+class TestRequestFraming:
+    """Test the length-prefixed wire protocol over a real socket."""
 
-    @pytest.fixture
-    def server(self, tmp_path):
-        """Create server instance for testing."""
-        mock_config = MagicMock()
-        mock_config.get_path.side_effect = lambda key: {
-            'memories_file': tmp_path / "memories.json",
-            'memory_dir': tmp_path
-        }.get(key, tmp_path / key)
+    def test_ping_round_trip(self, server):
+        """Client and server should agree on framing for a live ping."""
+        server._setup_socket()
 
-        with patch('server.MemoryStore'):
-            server = MemoryLaneServer(mock_config, socket_path=str(tmp_path / "test.sock"))
-            yield server
+        def serve_one():
+            conn, _ = server.server_socket.accept()
+            server._handle_client(conn)
+
+        thread = threading.Thread(target=serve_one, daemon=True)
+        thread.start()
+
+        client = MemoryLaneClient(socket_path=server.socket_path)
+        assert client.ping() is True
+
+        thread.join(timeout=5)
+        server.server_socket.close()
+        Path(server.socket_path).unlink()
+
+    def test_legacy_newline_client_still_served(self, server):
+        """Newline-delimited clients (VS Code extension) should still work."""
+        server._setup_socket()
+
+        def serve_one():
+            conn, _ = server.server_socket.accept()
+            server._handle_client(conn)
+
+        thread = threading.Thread(target=serve_one, daemon=True)
+        thread.start()
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(server.socket_path)
+        # Leading whitespace is legal JSON and must still sniff as legacy
+        sock.sendall(b' {"action": "ping"}\n')
+        data = b''
+        while not data.endswith(b'\n'):
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            data += chunk
+        sock.close()
+
+        response = json.loads(data.decode())
+        assert response['status'] == 'success'
+        assert response['message'] == 'pong'
+
+        thread.join(timeout=5)
+        server.server_socket.close()
+        Path(server.socket_path).unlink()
+
+
+class TestServerStats:
+    """Test server statistics tracking."""
 
     def test_stats_initialized(self, server):
         """Server should initialize stats."""
-        assert 'started_at' in server.stats
-        assert server.stats['requests_handled'] == 0
-        assert server.stats['errors'] == 0
+        assert server.stats.started_at
+        assert server.stats.requests_handled == 0
+        assert server.stats.errors == 0
 
 
 class TestUpdateUsage:
     """Test memory usage update."""
 
-    @pytest.fixture
-    def server(self, tmp_path):
-        """Create server instance for testing."""
-        mock_config = MagicMock()
-        mock_config.get_path.side_effect = lambda key: {
-            'memories_file': tmp_path / "memories.json",
-            'memory_dir': tmp_path
-        }.get(key, tmp_path / key)
-
-        with patch('server.MemoryStore') as mock_store:
-            server = MemoryLaneServer(mock_config, socket_path=str(tmp_path / "test.sock"))
-            yield server
-
     def test_process_update_usage(self, server):
         """Should process update_usage request."""
         request = {
@@ -237,19 +267,6 @@ class TestUpdateUsage:
 class TestShutdown:
     """Test server shutdown."""
 
-    @pytest.fixture
-    def server(self, tmp_path):
-        """Create server instance for testing."""
-        mock_config = MagicMock()
-        mock_config.get_path.side_effect = lambda key: {
-            'memories_file': tmp_path / "memories.json",
-            'memory_dir': tmp_path
-        }.get(key, tmp_path / key)
-
-        with patch('server.MemoryStore'):
-            server = MemoryLaneServer(mock_config, socket_path=str(tmp_path / "test.sock"))
-            yield server
-
     def test_process_shutdown_sets_running_false(self, server):
         """Shutdown request should set running to False."""
         # Patch sys.exit to prevent actual exit
@@ -292,14 +309,8 @@ class TestClientAddMemory:
 class TestPIDFileHandling:
     """Test PID file management."""
 
-    def test_server_checks_for_existing_pid(self, tmp_path):
+    def test_server_checks_for_existing_pid(self, mock_config, tmp_path):
         """Server should check for existing PID file."""
-        mock_config = MagicMock()
-        mock_config.get_path.side_effect = lambda key: {
-            'memories_file': tmp_path / "memories.json",
-            'memory_dir': tmp_path
-        }.get(key, tmp_path / key)
-
         # Create a stale PID file with non-existent process
         pid_file = tmp_path / "server.pid"
         pid_file.write_text("99999999")  # Unlikely to exist
@@ -314,19 +325,6 @@ class TestPIDFileHandling:
 class TestServerSocketSetup:
     """Test socket setup and cleanup."""
 
-    @pytest.fixture
-    def server(self, tmp_path):
-        """Create server instance for testing."""
-        mock_config = MagicMock()
-        mock_config.get_path.side_effect = lambda key: {
-            'memories_file': tmp_path / "memories.json",
-            'memory_dir': tmp_path
-        }.get(key, tmp_path / key)
-
-        with patch('server.MemoryStore'):
-            server = MemoryLaneServer(mock_config, socket_path=str(tmp_path / "test.sock"))
-            yield server
-
     def test_setup_socket_creates_unix_socket(self, server, tmp_path):
         """Should create Unix socket file."""
         server._setup_socket()
@@ -354,19 +352,6 @@ class TestServerSocketSetup:
 class TestServerStop:
     """Test server stop functionality."""
 
-    @pytest.fixture
-    def server(self, tmp_path):
-        """Create server instance for testing."""
-        mock_config = MagicMock()
-        mock_config.get_path.side_effect = lambda key: {
-            'memories_file': tmp_path / "memories.json",
-            'memory_dir': tmp_path
-        }.get(key, tmp_path / key)
-
-        with patch('server.MemoryStore'):
-            server = MemoryLaneServer(mock_config, socket_path=str(tmp_path / "test.sock"))
-            yield server
-
     def test_stop_sets_running_false(self, server):
         """Stop should set running to False."""
         server.running = True
@@ -402,19 +387,6 @@ class TestServerStop:
 class TestSignalHandler:
     """Test signal handling."""
 
-    @pytest.fixture
-    def server(self, tmp_path):
-        """Create server instance for testing."""
-        mock_config = MagicMock()
-        mock_config.get_path.side_effect = lambda key: {
-            'memories_file': tmp_path / "memories.json",
-            'memory_dir': tmp_path
-        }.get(key, tmp_path / key)
-
-        with patch('server.MemoryStore'):
-            server = MemoryLaneServer(mock_config, socket_path=str(tmp_path / "test.sock"))
-            yield server
-
     def test_signal_handler_calls_stop(self, server):
         """Signal handler should call stop."""
         with patch.object(server, 'stop') as mock_stop:
@@ -2,43 +2,55 @@
 Tests for LLM Summarizer Service.
 """
 
-import sys
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, DEFAULT
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from summarizer import SummarizerService
 
 
+@pytest.fixture(scope="module")
+def _summarizer_template():
+    """Plain service with patched dependencies, built once per module"""
+    with patch.multiple('summarizer', ModelManager=DEFAULT, PromptBuilder=DEFAULT):
+        yield SummarizerService()
+
+
+@pytest.fixture
+def summarizer(_summarizer_template):
+    """Shared service for the pure parsing/merging helpers.
+
+    Tests only call side-effect-free methods; config is reset here so
+    tests that assign one don't leak it into the next.
+    """
+    _summarizer_template.config = None
+    return _summarizer_template
+
+
 class TestSummarizerInitialization:
     """Test summarizer initialization."""
 
     def test_init_without_config(self):
         """Should initialize without config."""
-        with patch('summarizer.ModelManager'):
-            with patch('summarizer.PromptBuilder'):
-                summarizer = SummarizerService()
-                assert summarizer.config is None
+        with patch.multiple('summarizer', ModelManager=DEFAULT, PromptBuilder=DEFAULT):
+            summarizer = SummarizerService()
+            assert summarizer.config is None
 
     def test_init_with_config(self):
         """Should initialize with config."""
         mock_config = MagicMock()
         mock_config.get.return_value = 4096
 
-        with patch('summarizer.ModelManager'):
-            with patch('summarizer.PromptBuilder'):
-                summarizer = SummarizerService(config=mock_config)
-                assert summarizer.config == mock_config
+        with patch.multiple('summarizer', ModelManager=DEFAULT, PromptBuilder=DEFAULT):
+            summarizer = SummarizerService(config=mock_config)
+            assert summarizer.config == mock_config
 
     def test_init_creates_model_manager(self):
         """Should create model manager if not provided."""
-        with patch('summarizer.ModelManager') as mock_mm:
-            with patch('summarizer.PromptBuilder'):
-                summarizer = SummarizerService()
-                mock_mm.assert_called_once()
+        with patch.multiple('summarizer', ModelManager=DEFAULT, PromptBuilder=DEFAULT) as mocks:
+            SummarizerService()
+            mocks['ModelManager'].assert_called_once()
 
 
 class TestSummarizeText:
@@ -52,12 +64,15 @@ class TestSummarizeText:
 
         mock_prompt_builder = MagicMock()
 
-        with patch('summarizer.ModelManager', return_value=mock_model_manager):
-            with patch('summarizer.PromptBuilder', return_value=mock_prompt_builder):
-                summarizer = SummarizerService()
-                summarizer.model_manager = mock_model_manager
-                summarizer.prompt_builder = mock_prompt_builder
-                yield summarizer
+        with patch.multiple(
+            'summarizer',
+            ModelManager=MagicMock(return_value=mock_model_manager),
+            PromptBuilder=MagicMock(return_value=mock_prompt_builder),
+        ):
+            summarizer = SummarizerService()
+            summarizer.model_manager = mock_model_manager
+            summarizer.prompt_builder = mock_prompt_builder
+            yield summarizer
 
     def test_returns_none_for_empty_text(self, summarizer):
         """Should return None for empty text."""
@@ -97,17 +112,31 @@ class TestSummarizeText:
         result = summarizer.summarize_text("Short text")
         assert result is None
 
+    def test_parallel_chunks_merge_all_results(self, summarizer):
+        """Parallel chunk summarization should merge every chunk's result."""
+        summarizer.config = MagicMock()
+        summarizer.config.get.side_effect = lambda key, default: {
+            'summarizer.max_input_tokens': 600,  # Forces multiple chunks
+            'summarizer.parallel_chunks': True
+        }.get(key, default)
+
+        summarizer._summarize_payload = lambda payload: {
+            'summary': 'Part.',
+            'memory_entries': [{'content': payload['raw_transcript'][:40]}],
+            'suggested_deletions': []
+        }
+
+        text = ' '.join(f'word{i}' for i in range(900))
+        result = summarizer.summarize_text(text)
+
+        expected_chunks = len(summarizer._chunk_text(text))
+        assert expected_chunks > 1
+        assert len(result['memory_entries']) == expected_chunks
+
 
 class TestParseOutput:
     """Test model output parsing."""
 
-    @pytest.fixture
-    def summarizer(self):
-        """Create summarizer for testing."""
-        with patch('summarizer.ModelManager'):
-            with patch('summarizer.PromptBuilder'):
-                yield SummarizerService()
-
     def test_parse_valid_json(self, summarizer):
         """Should parse valid JSON output."""
         text = '{"summary": "Test summary", "memory_entries": []}'
@@ -155,13 +184,6 @@ class TestParseOutput:
 class TestExtractJson:
     """Test JSON extraction from model output."""
 
-    @pytest.fixture
-    def summarizer(self):
-        """Create summarizer for testing."""
-        with patch('summarizer.ModelManager'):
-            with patch('summarizer.PromptBuilder'):
-                yield SummarizerService()
-
     def test_extract_plain_json(self, summarizer):
         """Should extract plain JSON."""
         text = '{"key": "value"}'
@@ -211,13 +233,6 @@ class TestExtractJson:
 class TestMergeResults:
     """Test merging multi-chunk results."""
 
-    @pytest.fixture
-    def summarizer(self):
-        """Create summarizer for testing."""
-        with patch('summarizer.ModelManager'):
-            with patch('summarizer.PromptBuilder'):
-                yield SummarizerService()
-
     def test_merge_empty_results(self, summarizer):
         """Should return None for empty results."""
         result = summarizer._merge_results([])
@@ -262,13 +277,6 @@ class TestMergeResults:
 class TestTrimSummary:
     """Test summary trimming."""
 
-    @pytest.fixture
-    def summarizer(self):
-        """Create summarizer for testing."""
-        with patch('summarizer.ModelManager'):
-            with patch('summarizer.PromptBuilder'):
-                yield SummarizerService()
-
     def test_short_summary_unchanged(self, summarizer):
         """Short summaries should remain unchanged."""
         summary = "One sentence. Two sentences."
@@ -299,13 +307,6 @@ class TestTrimSummary:
 class TestDedupeEntries:
     """Test memory entry deduplication."""
 
-    @pytest.fixture
-    def summarizer(self):
-        """Create summarizer for testing."""
-        with patch('summarizer.ModelManager'):
-            with patch('summarizer.PromptBuilder'):
-                yield SummarizerService()
-
     def test_dedupe_removes_duplicates(self, summarizer):
         """Should remove duplicate entries."""
         entries = [
@@ -346,13 +347,6 @@ class TestDedupeEntries:
 class TestChunkText:
     """Test text chunking."""
 
-    @pytest.fixture
-    def summarizer(self):
-        """Create summarizer for testing."""
-        with patch('summarizer.ModelManager'):
-            with patch('summarizer.PromptBuilder'):
-                yield SummarizerService()
-
     def test_short_text_single_chunk(self, summarizer):
         """Short text should be single chunk."""
         text = "Short text here"
@@ -379,13 +373,6 @@ class TestChunkText:
 class TestEstimateTokens:
     """Test token estimation."""
 
-    @pytest.fixture
-    def summarizer(self):
-        """Create summarizer for testing."""
-        with patch('summarizer.ModelManager'):
-            with patch('summarizer.PromptBuilder'):
-                yield SummarizerService()
-
     def test_estimate_empty_string(self, summarizer):
         """Empty string should have 0 tokens."""
         result = summarizer._estimate_tokens("")
@@ -400,17 +387,18 @@ class TestEstimateTokens:
         # 5 * 1.3 = 6.5 -> 6
         assert result == 6
 
+    def test_estimate_counts_newline_separated_words(self, summarizer):
+        """Newline-separated transcripts should estimate like spaced text."""
+        text = "one\ntwo\nthree\nfour\nfive"  # 5 words
+
+        result = summarizer._estimate_tokens(text)
+
+        assert result == 6
+
 
 class TestGetConfigValue:
     """Test config value retrieval."""
 
-    @pytest.fixture
-    def summarizer(self):
-        """Create summarizer for testing."""
-        with patch('summarizer.ModelManager'):
-            with patch('summarizer.PromptBuilder'):
-                yield SummarizerService()
-
     def test_returns_default_when_no_config(self, summarizer):
         """Should return default when config is None."""
         summarizer.config = None